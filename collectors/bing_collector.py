@@ -3,6 +3,7 @@ Bing検索情報収集モジュール
 """
 
 import re
+import threading
 import time
 import requests
 from bs4 import BeautifulSoup
@@ -10,6 +11,7 @@ from typing import List, Dict, Any, Optional
 from urllib.parse import urlparse, quote_plus
 from core.interfaces import SearchEngineCollector, CollectionResult, SearchResult
 from utils.execution_logger import ExecutionLogger
+from utils.http_client import PooledSession, mount_pooled_adapter
 from config import (
     get_search_patterns, GOOGLE_PAGE_LIMIT, YOUTUBE_MAX_URLS,
     BING_DEFAULT_DELAY, BING_PATTERN_DELAY_MULTIPLIER, BING_DEFAULT_RESULTS,
@@ -33,7 +35,8 @@ class BingCollector(SearchEngineCollector):
             delay: リクエスト間の待機時間（秒）
         """
         super().__init__(delay or BING_DEFAULT_DELAY, **kwargs)
-        self.session = requests.Session()
+        # リトライはcollect_info側で行うため、アダプターのリトライは無効にする
+        self.session = mount_pooled_adapter(PooledSession(), with_retry=False)
         self.session.headers.update({
             'User-Agent': WINDOWS_USER_AGENT
         })
@@ -47,10 +50,12 @@ class BingCollector(SearchEngineCollector):
             num_results: 取得する検索結果数
             logger: 実行ログ記録用
             api_key: OpenAI API Key（オプション）
+            cancel_event: セットされたら残りの検索パターンを打ち切るイベント（kwargs、タイムアウト用）
             
         Returns:
             収集した情報の辞書
         """
+        cancel_event: Optional[threading.Event] = kwargs.get("cancel_event")
         try:
             all_search_results = []
             
@@ -60,6 +65,8 @@ class BingCollector(SearchEngineCollector):
             results_per_pattern = max(1, (num_results or BING_DEFAULT_RESULTS) // len(search_patterns))
             
             for i, pattern in enumerate(search_patterns, 1):
+                if cancel_event is not None and cancel_event.is_set():
+                    break
                 print(f"\n    パターン{i}/{len(search_patterns)}: '{pattern}'")
                 pattern_results = self._search_single_pattern(pattern, results_per_pattern, name, api_key)
                 all_search_results.extend(pattern_results)
@@ -68,7 +75,12 @@ class BingCollector(SearchEngineCollector):
                 # パターン間で大幅待機（レート制限対策）
                 if i < len(search_patterns):
                     print(f"      {self.delay * BING_PATTERN_DELAY_MULTIPLIER}秒待機中...")
-                    time.sleep(self.delay * BING_PATTERN_DELAY_MULTIPLIER)
+                    if cancel_event is not None:
+                        # 待機中にタイムアウトした場合はすぐに打ち切る
+                        if cancel_event.wait(self.delay * BING_PATTERN_DELAY_MULTIPLIER):
+                            break
+                    else:
+                        time.sleep(self.delay * BING_PATTERN_DELAY_MULTIPLIER)
             
             # SearchResultオブジェクトに変換
             search_result_objects = []
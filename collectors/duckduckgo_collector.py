@@ -2,12 +2,12 @@
 DuckDuckGo検索モジュール（Google検索の代替）
 """
 
-import requests
 import time
 from bs4 import BeautifulSoup
 from typing import List, Dict, Any, Optional
 from core.interfaces import SearchEngineCollector, CollectionResult, SearchResult
 from utils.execution_logger import ExecutionLogger
+from utils.http_client import PooledSession, mount_pooled_adapter
 from config import (
     get_search_patterns,
     DEFAULT_DELAY,
@@ -34,7 +34,7 @@ class DuckDuckGoCollector(SearchEngineCollector):
             delay: リクエスト間の待機時間（秒）
         """
         super().__init__(delay, **kwargs)
-        self.session = requests.Session()
+        self.session = mount_pooled_adapter(PooledSession())
         
         # より現実的なブラウザヘッダーを設定
         self.session.headers.update({
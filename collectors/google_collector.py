@@ -4,37 +4,93 @@ Google検索情報収集モジュール（Custom Search JSON API使用）
 
 import re
 import time
+import logging
+import threading
 import requests
-import random
+import orjson
+import lxml.html
+from lxml import etree
 import os
-from bs4 import BeautifulSoup
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from functools import lru_cache
+import urllib.parse
 from urllib.parse import urlparse
-from googlesearch import search
 
 from core.interfaces import SearchEngineCollector, CollectionResult, SearchResult, CharacterQuote
 from core.exceptions import SearchEngineError
 from utils.api_client import OpenAIClient
 from utils.execution_logger import ExecutionLogger
+from utils.cache import TTLCache
+from utils.rate_limiter import TokenBucket, SlidingWindow, parse_retry_after
+from utils.http_client import BaseHTTPClient, PooledSession, mount_pooled_adapter, safe_http_get, read_limited_content
 from config import (
     GOOGLE_DELAY, GOOGLE_RESULTS, GOOGLE_API_RESULTS, GOOGLE_PAGE_LIMIT,
-    YOUTUBE_MAX_URLS, YOUTUBE_SEARCH_DELAY, GOOGLE_FALLBACK_DELAY_MULTIPLIER,
-    GOOGLE_MIN_DELAY, GOOGLE_URL_FETCH_DELAY, GOOGLE_PAGE_DELAY_MULTIPLIER,
-    GOOGLE_YOUTUBE_DELAY_MULTIPLIER, GOOGLE_CX_DISPLAY_LENGTH,
+    YOUTUBE_MAX_URLS, GOOGLE_CX_DISPLAY_LENGTH,
     GOOGLE_API_MAX_RESULTS_PER_REQUEST, GOOGLE_FALLBACK_MAX_RETRIES,
-    GOOGLE_FALLBACK_RETRY_DELAY, GOOGLE_PATTERN_TIMEOUT, GOOGLE_SEARCH_TIMEOUT,
+    GOOGLE_FALLBACK_RETRY_DELAY, GOOGLE_PATTERN_TIMEOUT,
     GOOGLE_MIN_TEXT_LENGTH_FOR_API, GOOGLE_YOUTUBE_API_RESULTS, REQUEST_TIMEOUT,
     HTTP_STATUS_OK, HTTP_STATUS_FORBIDDEN, HTTP_STATUS_TOO_MANY_REQUESTS,
     SAMPLE_QUALITY_MIN_LENGTH, BING_NAME_LENGTH_CHECK, MAX_RETRIES,
-    DEFAULT_USER_AGENT, PREVIEW_LENGTH_LONG, THREAD_POOL_MAX_WORKERS_SINGLE,
-    GOOGLE_429_EXTRA_DELAY, GOOGLE_FETCH_PAGE_CONTENT, HTTP_STATUS_NOT_FOUND
+    DEFAULT_USER_AGENT, PREVIEW_LENGTH_LONG,
+    GOOGLE_429_EXTRA_DELAY, GOOGLE_FETCH_PAGE_CONTENT, HTTP_STATUS_NOT_FOUND,
+    GOOGLE_HTML_CONTENT_TYPES, GOOGLE_PAGE_MAX_BYTES, GOOGLE_API_MAX_CONCURRENCY, GOOGLE_PAGE_FETCH_CONCURRENCY,
+    GOOGLE_API_CACHE_TTL, GOOGLE_API_CACHE_MAX_SIZE, PAGE_CONTENT_CACHE_TTL,
+    PAGE_CONTENT_CACHE_MAX_SIZE, GOOGLE_API_QPS, GOOGLE_API_BUCKET_CAPACITY,
+    GOOGLE_SCRAPE_BUCKET_CAPACITY, GOOGLE_RATE_LIMIT_PENALTY_TOKENS,
+    GOOGLE_SCRAPE_WINDOW_SECONDS, GOOGLE_SCRAPE_WINDOW_LIMIT, CHATGPT_FILTER_TEXT_LIMIT,
+    SPEECH_PATTERN_CACHE_TTL, SPEECH_PATTERN_CACHE_MAX_SIZE, HTTP_STREAM_CHUNK_SIZE
 )
 
 
+# 検索結果に影響するAPIパラメータ（キャッシュキーに使用）
+_API_CACHE_KEY_PARAMS = ('q', 'cx', 'num', 'lr', 'gl', 'siteSearch')
+
+# 本文を取得できないため取得前に除外する拡張子・ホスト
+_BAD_EXTS = frozenset({'.pdf', '.jpg', '.jpeg', '.png', '.gif', '.mp4', '.mp3', '.zip', '.webp', '.svg'})
+_SKIP_HOSTS = frozenset({'twitter.com', 'x.com', 'instagram.com', 'tiktok.com'})
+
+# 本文抽出時に除去するタグ
+_STRIP_TAGS = ("script", "style", "nav", "header", "footer")
+
+# 本文抽出用の正規表現
+_WHITESPACE_RE = re.compile(r'\s+')
+_CHARSET_RE = re.compile(r'charset=["\']?([\w-]+)')
+
+# YouTube動画URLの判定と動画IDの抽出
+_YT_WATCH = re.compile(r'youtube\.com/watch\?v=([A-Za-z0-9_-]{11})')
+
+# プロセス内で共有するキャッシュ
+_API_RESPONSE_CACHE = TTLCache(GOOGLE_API_CACHE_MAX_SIZE, GOOGLE_API_CACHE_TTL)
+_PAGE_CONTENT_CACHE = TTLCache(PAGE_CONTENT_CACHE_MAX_SIZE, PAGE_CONTENT_CACHE_TTL)
+_SPEECH_PATTERN_CACHE = TTLCache(SPEECH_PATTERN_CACHE_MAX_SIZE, SPEECH_PATTERN_CACHE_TTL)
+
+
+@lru_cache(maxsize=256)
+def _build_search_patterns(name: str) -> Tuple[str, ...]:
+    """
+    キャラクター名から検索パターンを生成（変更されないようタプルで返す）
+    
+    Args:
+        name: キャラクター名
+        
+    Returns:
+        検索パターンのタプル
+    """
+    return (
+        f'"{name}"',
+        f'{name} キャラクター',
+        f'{name} 口調',
+        f'{name} 話し方',
+        f'{name} セリフ'
+    )
+
+
 class GoogleCollector(SearchEngineCollector):
     """Google Custom Search JSON APIを使用して検索結果から情報を収集するクラス"""
     
-    def __init__(self, delay: float = None, google_api_key: str = None, google_cx: str = None, **kwargs):
+    def __init__(self, delay: float = None, google_api_key: str = None, google_cx: str = None, openai_api_key: str = None, **kwargs):
         """
         初期化
         
@@ -42,9 +98,13 @@ class GoogleCollector(SearchEngineCollector):
             delay: リクエスト間の待機時間（秒）
             google_api_key: Google Custom Search API Key
             google_cx: Google Custom Search Engine ID
+            openai_api_key: OpenAI API Key（指定時はクライアントを事前に生成）
         """
         super().__init__(delay or GOOGLE_DELAY, **kwargs)
-        self.session = requests.Session()
+        # 429はcollect_info側でクールダウン・トークン差し引きを行うため、アダプターのリトライは無効にする
+        # （アダプター内で再送されると最初の429が見えず、レート制限の計数もずれる）
+        self.session = mount_pooled_adapter(PooledSession(), with_retry=False)
+        self._log = logging.getLogger(__name__)
         
         # Google Custom Search API設定
         self.google_api_key = google_api_key or os.environ.get("GOOGLE_API_KEY")
@@ -53,18 +113,50 @@ class GoogleCollector(SearchEngineCollector):
         # Custom Search JSON API URL
         self.api_base_url = "https://www.googleapis.com/customsearch/v1"
         
+        # Custom Search APIへの同時リクエスト数を制限するセマフォ
+        self._api_semaphore = threading.Semaphore(GOOGLE_API_MAX_CONCURRENCY)
+        
+        # ページ取得の同時リクエスト数を制限するセマフォ（全パターン共通）
+        self._page_semaphore = threading.Semaphore(GOOGLE_PAGE_FETCH_CONCURRENCY)
+        
+        # パターン間で共有する取得済みURL集合の排他制御
+        self._seen_lock = threading.Lock()
+        
+        # リクエスト頻度の制限（固定の待機の代わりにトークンバケットで制御）
+        self._api_bucket = TokenBucket(rate=GOOGLE_API_QPS, capacity=GOOGLE_API_BUCKET_CAPACITY)
+        self._scrape_bucket = TokenBucket(rate=1.0 / self.delay, capacity=GOOGLE_SCRAPE_BUCKET_CAPACITY)
+        
+        # 検索結果ページ直接取得の直近リクエスト数と429エラー後のクールダウンを管理
+        self._scrape_window = SlidingWindow(window=GOOGLE_SCRAPE_WINDOW_SECONDS, limit=GOOGLE_SCRAPE_WINDOW_LIMIT)
+        
+        # OpenAI APIクライアント（API Keyごとに1つだけ生成して使い回す）
+        self._openai_clients: Dict[str, OpenAIClient] = {}
+        self._openai: Optional[OpenAIClient] = None
+        if openai_api_key:
+            self._get_openai_client(openai_api_key)
+        
+        # 生成するSearchResultに記録する検索クエリの説明
+        self._query_description: Optional[str] = None
+        
         # 標準的なHTTPヘッダー
         self.session.headers.update({
             'User-Agent': DEFAULT_USER_AGENT,
             'Accept': 'application/json',
-            'Accept-Language': 'ja,en-US;q=0.9,en;q=0.8'
+            'Accept-Language': 'ja,en-US;q=0.9,en;q=0.8',
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive'
         })
         
+        # ページ取得用のHTTPクライアント（コネクションプールを全ページで共有）
+        # リトライはBaseHTTPClient側で行うため、アダプターのリトライは無効にする
+        self._page_client = BaseHTTPClient(delay=0, timeout=REQUEST_TIMEOUT)
+        mount_pooled_adapter(self._page_client.session, with_retry=False)
+        
         if self.google_api_key and self.google_cx:
-            print(f"  Google Custom Search API: 有効 (CX: {self.google_cx[:GOOGLE_CX_DISPLAY_LENGTH]}...)")
+            self._log.info("  Google Custom Search API: 有効 (CX: %s...)", self.google_cx[:GOOGLE_CX_DISPLAY_LENGTH])
         else:
-            print(f"  Google Custom Search API: 無効 (フォールバック検索を使用)")
-            print(f"    💡 設定方法: GOOGLE_API_KEY と GOOGLE_CX 環境変数を設定")
+            self._log.info("  Google Custom Search API: 無効 (フォールバック検索を使用)")
+            self._log.info("    💡 設定方法: GOOGLE_API_KEY と GOOGLE_CX 環境変数を設定")
     
     
     def collect_info(self, name: str, logger: Optional[ExecutionLogger] = None, api_key: Optional[str] = None, num_results: int = None, **kwargs) -> CollectionResult:
@@ -76,89 +168,137 @@ class GoogleCollector(SearchEngineCollector):
             logger: 実行ログ記録用
             api_key: OpenAI API Key（オプション）
             num_results: 取得する検索結果数
+            cancel_event: セットされたら残りの検索パターンを打ち切るイベント（kwargs、タイムアウト用）
             
         Returns:
             収集した情報
         """
         start_time = time.time()
         num_results = num_results or GOOGLE_RESULTS
+        cancel_event: Optional[threading.Event] = kwargs.get("cancel_event")
         
         try:
             all_search_results = []
             
+            # OpenAIクライアントはページごとに生成せず、コレクター全体で使い回す
+            self._openai = self._get_openai_client(api_key) if api_key else None
+            query_description = "複数パターン検索（Custom Search API）" if self.google_api_key else "複数パターン検索（フォールバック）"
+            self._query_description = query_description
+            search_patterns = self._get_search_patterns(name)
+            
+            # 複数パターンで重複して返るページは1回だけ取得する
+            seen_urls: Set[Tuple[str, str]] = set()
+            
             # Custom Search APIが利用可能かチェック
             if self.google_api_key and self.google_cx:
-                print(f"    Google Custom Search APIを使用")
+                self._log.info("    Google Custom Search APIを使用")
                 # Custom Search APIを使用
-                search_patterns = self._get_search_patterns(name)
-                print(f"    {len(search_patterns)}個の検索パターンを使用")
+                self._log.info("    %s個の検索パターンを使用", len(search_patterns))
                 results_per_pattern = max(1, min(GOOGLE_API_RESULTS, num_results // len(search_patterns)))  # API制限考慮
                 
-                for i, pattern in enumerate(search_patterns):
-                    print(f"\n    パターン{i+1}/{len(search_patterns)}: '{pattern}'")
-                    pattern_results = self._search_with_api(pattern, results_per_pattern, name, api_key, logger)
-                    all_search_results.extend(pattern_results)
-                    print(f"      ✅ {len(pattern_results)}件の結果を取得")
+                # 各パターンの検索を並列実行（同時リクエスト数はセマフォで制限）
+                with ThreadPoolExecutor(max_workers=GOOGLE_API_MAX_CONCURRENCY) as executor:
+                    futures = [
+                        executor.submit(self._search_with_api, pattern, results_per_pattern, name, api_key, logger, seen_urls)
+                        for pattern in search_patterns
+                    ]
                     
-                    # API制限対策で適度な待機
-                    time.sleep(self.delay)
+                    # 結果の順序はパターン順に揃える
+                    for i, (pattern, future) in enumerate(zip(search_patterns, futures)):
+                        if cancel_event is not None and cancel_event.is_set():
+                            for pending in futures:
+                                pending.cancel()
+                            break
+                        pattern_results = future.result()
+                        all_search_results.extend(pattern_results)
+                        self._log.info("    パターン%s/%s: '%s'", i + 1, len(search_patterns), pattern)
+                        self._log.info("      ✅ %s件の結果を取得", len(pattern_results))
             else:
                 # フォールバック: 従来の検索方法
-                print("⚠️  Google Custom Search APIが設定されていません。フォールバック検索を使用します。")
-                search_patterns = self._get_search_patterns(name)
-                print(f"    {len(search_patterns)}個の検索パターンを使用")
+                self._log.warning("⚠️  Google Custom Search APIが設定されていません。フォールバック検索を使用します。")
+                self._log.info("    %s個の検索パターンを使用", len(search_patterns))
                 results_per_pattern = max(1, num_results // len(search_patterns))
                 
                 for i, pattern in enumerate(search_patterns):
-                    print(f"\n    パターン{i+1}/{len(search_patterns)}: '{pattern}'")
-                    pattern_results = self._search_single_pattern_fallback(pattern, results_per_pattern, name, api_key, logger)
+                    if cancel_event is not None and cancel_event.is_set():
+                        break
+                    self._log.info("    パターン%s/%s: '%s'", i + 1, len(search_patterns), pattern)
+                    pattern_results = self._search_single_pattern_fallback(pattern, results_per_pattern, name, api_key, logger, seen_urls)
                     all_search_results.extend(pattern_results)
-                    print(f"      ✅ {len(pattern_results)}件の結果を取得")
-                    
-                    # レート制限対策で大幅待機
-                    time.sleep(self.delay * GOOGLE_FALLBACK_DELAY_MULTIPLIER)
+                    self._log.info("      ✅ %s件の結果を取得", len(pattern_results))
             
-            duration = time.time() - start_time
-            query_description = "複数パターン検索（Custom Search API）" if self.google_api_key else "複数パターン検索（フォールバック）"
+            # 口調・セリフパターンは全ページ分をまとめて1回のAPI呼び出しで抽出
+            self._apply_speech_patterns_batch(all_search_results, name, logger)
             
-            # SearchResultオブジェクトに変換
-            search_result_objects = []
-            for result_dict in all_search_results:
-                try:
-                    search_result = SearchResult(
-                        url=result_dict.get("url", ""),
-                        title=result_dict.get("title", ""),
-                        description=result_dict.get("description", ""),
-                        content=result_dict.get("content", ""),
-                        domain=result_dict.get("domain", ""),
-                        content_length=result_dict.get("content_length", 0),
-                        speech_patterns=result_dict.get("speech_patterns", []),
-                        source="google",
-                        search_query=query_description
-                    )
-                    search_result_objects.append(search_result)
-                except Exception as e:
-                    if logger:
-                        logger.log_error("search_result_conversion_error", str(e), result_dict)
-                    continue
+            duration = time.time() - start_time
             
-            return self._create_success_result(search_result_objects, query_description, duration)
+            return self._create_success_result(all_search_results, query_description, duration)
             
         except Exception as e:
             return self._create_error_result(f"Google検索エラー: {str(e)}", "複数パターン検索")
     
-    def _get_search_patterns(self, name: str) -> List[str]:
-        """検索パターンを生成"""
-        patterns = [
-            f'"{name}"',
-            f'{name} キャラクター',
-            f'{name} 口調',
-            f'{name} 話し方',
-            f'{name} セリフ'
+    def _get_openai_client(self, api_key: str) -> OpenAIClient:
+        """
+        API Keyに対応するOpenAIクライアントを取得（未生成の場合のみ生成）
+        
+        Args:
+            api_key: OpenAI API Key
+            
+        Returns:
+            OpenAIクライアント
+        """
+        client = self._openai_clients.get(api_key)
+        if client is None:
+            client = OpenAIClient(api_key)
+            self._openai_clients[api_key] = client
+        return client
+    
+    def _apply_speech_patterns_batch(self, search_results: List[SearchResult], character_name: str, logger=None) -> None:
+        """
+        取得済みページの口調・セリフパターンをChatGPT APIでまとめて抽出
+        
+        Args:
+            search_results: 検索結果のリスト（speech_patternsを直接更新）
+            character_name: キャラクター名
+            logger: ログ記録用
+        """
+        if not self._openai:
+            return
+        
+        # パターン未抽出かつ十分なテキストがある結果のみ対象
+        targets = [
+            result for result in search_results
+            if not result.speech_patterns and len(result.content.strip()) > GOOGLE_MIN_TEXT_LENGTH_FOR_API
         ]
-        return patterns
+        
+        # 同じ本文（API送信範囲）の抽出結果があればキャッシュを使用
+        pending = []
+        for result in targets:
+            cached_patterns = _SPEECH_PATTERN_CACHE.get((character_name, result.content[:CHATGPT_FILTER_TEXT_LIMIT]))
+            if cached_patterns is not None:
+                result.speech_patterns = list(cached_patterns)
+            else:
+                pending.append(result)
+        if not pending:
+            return
+        
+        self._log.info("    %sページの口調パターンを一括抽出中 (ChatGPT API)...", len(pending))
+        patterns_list = self._openai.extract_speech_patterns_batch(
+            [result.content for result in pending],
+            character_name,
+            logger
+        )
+        for result, speech_patterns in zip(pending, patterns_list):
+            result.speech_patterns = speech_patterns
+            if speech_patterns:
+                _SPEECH_PATTERN_CACHE.set((character_name, result.content[:CHATGPT_FILTER_TEXT_LIMIT]), tuple(speech_patterns))
+    
+    def _get_search_patterns(self, name: str) -> Tuple[str, ...]:
+        """検索パターンを生成（同じ名前の場合はキャッシュを返す）"""
+        return _build_search_patterns(name)
     
-    def _search_with_api(self, search_query: str, max_results: int, character_name: str = "", api_key: str = None, logger=None) -> List[Dict[str, Any]]:
+    def _search_with_api(self, search_query: str, max_results: int, character_name: str = "", api_key: str = None, logger=None,
+                         seen_urls: Optional[Set[Tuple[str, str]]] = None) -> List[SearchResult]:
         """
         Google Custom Search APIを使用して検索を実行
         
@@ -168,6 +308,7 @@ class GoogleCollector(SearchEngineCollector):
             character_name: キャラクター名
             api_key: OpenAI API Key
             logger: ログ記録用
+            seen_urls: 他パターンで取得済みのURLキー集合（重複URLはスキップ）
             
         Returns:
             検索結果のリスト
@@ -175,88 +316,53 @@ class GoogleCollector(SearchEngineCollector):
         search_results = []
         
         try:
-            # Custom Search API パラメータ
-            params = {
-                'key': self.google_api_key,
-                'cx': self.google_cx,
-                'q': search_query,
-                'num': min(max_results, GOOGLE_API_MAX_RESULTS_PER_REQUEST),  # APIは最大件数まで（Google制限）
-                'lr': 'lang_ja',  # 日本語結果を優先
-                'gl': 'jp',  # 日本からの検索として実行
-                'safe': 'off'  # セーフサーチオフ
-            }
-            
-            print(f"      Google Custom Search APIリクエスト送信中...")
-            print(f"      API Key: {self.google_api_key[:10]}... (length: {len(self.google_api_key)})")
-            print(f"      CX: {self.google_cx[:GOOGLE_CX_DISPLAY_LENGTH] if self.google_cx else 'None'}... (length: {len(self.google_cx) if self.google_cx else 0})")
+            self._log.debug("      Google Custom Search APIリクエスト送信中...")
+            self._log.debug("      API Key: %s... (length: %s)", self.google_api_key[:10], len(self.google_api_key))
+            self._log.debug("      CX: %s... (length: %s)", self.google_cx[:GOOGLE_CX_DISPLAY_LENGTH] if self.google_cx else 'None', len(self.google_cx) if self.google_cx else 0)
             
-            response = self.session.get(self.api_base_url, params=params, timeout=REQUEST_TIMEOUT)
+            data, response = self._api_call(search_query, max_results)
             
-            if response.status_code == HTTP_STATUS_OK:
-                data = response.json()
-                
+            if data is not None:
                 if 'items' in data:
-                    print(f"      APIから{len(data['items'])}件の結果を取得")
+                    self._log.info("      APIから%s件の結果を取得", len(data['items']))
                     
-                    for item in data['items']:
-                        try:
-                            url = item.get('link', '')
-                            title = item.get('title', '')
-                            snippet = item.get('snippet', '')
-                            
-                            if url and title:
-                                if GOOGLE_FETCH_PAGE_CONTENT:
-                                    # ページ内容を詳細取得
-                                    print(f"        ページ取得中: {url[:50]}...")
-                                    content_info = self._extract_page_content(url, character_name, api_key, logger)
-                                    if content_info:
-                                        # API結果の情報もマージ
-                                        content_info['api_title'] = title
-                                        content_info['api_snippet'] = snippet
-                                        search_results.append(content_info)
-                                    else:
-                                        # ページ取得に失敗した場合はAPI結果のみ使用
-                                        content_info = {
-                                            "url": url,
-                                            "domain": self._extract_domain(url),
-                                            "title": title,
-                                            "description": snippet,
-                                            "content": snippet,
-                                            "content_length": len(snippet),
-                                            "speech_patterns": self._extract_basic_patterns(snippet + " " + title, character_name)
-                                        }
-                                        search_results.append(content_info)
-                                else:
-                                    # ページ取得をスキップしてAPI結果のみ使用（高速化）
-                                    content_info = {
-                                        "url": url,
-                                        "domain": self._extract_domain(url),
-                                        "title": title,
-                                        "description": snippet,
-                                        "content": snippet,
-                                        "content_length": len(snippet),
-                                        "speech_patterns": []
-                                    }
-                                    search_results.append(content_info)
-                                
-                                # ページ間の適度な待機
-                                time.sleep(self.delay)
-                                
-                        except Exception as e:
-                            print(f"    API結果処理エラー: {e}")
-                            continue
+                    # URLとタイトルがあり、他パターンで未取得の結果のみ対象
+                    items = [
+                        (item.get('link', ''), item.get('title', ''), item.get('snippet', ''))
+                        for item in data['items']
+                        if item.get('link') and item.get('title') and self._is_new_url(item['link'], seen_urls)
+                    ]
+                    
+                    if GOOGLE_FETCH_PAGE_CONTENT:
+                        # ページ内容を並列で詳細取得
+                        pages = self._fetch_pages([url for url, _, _ in items], character_name, api_key, logger)
+                    else:
+                        # ページ取得をスキップしてAPI結果のみ使用（高速化）
+                        pages = [None] * len(items)
+                    
+                    for (url, title, snippet), content_info in zip(items, pages):
+                        if content_info:
+                            search_results.append(content_info)
+                        elif GOOGLE_FETCH_PAGE_CONTENT:
+                            # ページ取得に失敗した場合はAPI結果のみ使用
+                            search_results.append(self._create_snippet_result(
+                                url, title, snippet,
+                                self._extract_basic_patterns(snippet + " " + title, character_name)
+                            ))
+                        else:
+                            search_results.append(self._create_snippet_result(url, title, snippet, []))
                 else:
-                    print(f"      ⚠️ 検索結果がありません")
+                    self._log.warning("      ⚠️ 検索結果がありません")
                     
             elif response.status_code == HTTP_STATUS_TOO_MANY_REQUESTS:
-                print(f"      ❌ Google Custom Search APIの日次クォータを超過しました（429エラー）")
-                print(f"      💡 対処法:")
-                print(f"         1. --use-bing フラグでBing検索を使用")
-                print(f"         2. --use-chatgpt-search フラグでChatGPT知識ベースを使用")
-                print(f"         3. --no-google フラグでGoogle検索を無効化")
-                print(f"         4. 翌日まで待つ（クォータは日本時間午前0時にリセット）")
+                self._log.error("      ❌ Google Custom Search APIの日次クォータを超過しました（429エラー）")
+                self._log.info("      💡 対処法:")
+                self._log.info("         1. --use-bing フラグでBing検索を使用")
+                self._log.info("         2. --use-chatgpt-search フラグでChatGPT知識ベースを使用")
+                self._log.info("         3. --no-google フラグでGoogle検索を無効化")
+                self._log.info("         4. 翌日まで待つ（クォータは日本時間午前0時にリセット）")
             elif response.status_code == HTTP_STATUS_FORBIDDEN:
-                print(f"      ❌ API認証エラー: API Keyが無効または設定ミス")
+                self._log.error("      ❌ API認証エラー: API Keyが無効または設定ミス")
                 if logger:
                     logger.log_error("google_api_quota_error", "Google Custom Search API quota exceeded", {
                         "search_query": search_query,
@@ -264,21 +370,21 @@ class GoogleCollector(SearchEngineCollector):
                         "response": response.text[:PREVIEW_LENGTH_LONG]
                     })
             else:
-                print(f"      ❌ API検索失敗: HTTP {response.status_code}")
+                self._log.error("      ❌ API検索失敗: HTTP %s", response.status_code)
                 if response.status_code == HTTP_STATUS_TOO_MANY_REQUESTS:
-                    print(f"      ❌ Google Custom Search APIの日次クォータを超過しました")
-                    print(f"      💡 対処法:")
-                    print(f"         1. --use-bing フラグでBing検索を使用")
-                    print(f"         2. --use-chatgpt-search フラグでChatGPT知識ベースを使用")
-                    print(f"         3. --no-google フラグでGoogle検索を無効化")
-                    print(f"         4. 翌日まで待つ（クォータは日本時間午前0時にリセット）")
+                    self._log.error("      ❌ Google Custom Search APIの日次クォータを超過しました")
+                    self._log.info("      💡 対処法:")
+                    self._log.info("         1. --use-bing フラグでBing検索を使用")
+                    self._log.info("         2. --use-chatgpt-search フラグでChatGPT知識ベースを使用")
+                    self._log.info("         3. --no-google フラグでGoogle検索を無効化")
+                    self._log.info("         4. 翌日まで待つ（クォータは日本時間午前0時にリセット）")
                 elif response.status_code == HTTP_STATUS_NOT_FOUND:
-                    print(f"      ❌ Google Custom Search Engine ID (CX) が無効です")
-                    print(f"      💡 対処法:")
-                    print(f"         1. Google Custom Search Engineを作成: https://programmablesearchengine.google.com/")
-                    print(f"         2. 環境変数 GOOGLE_CX に検索エンジンIDを設定")
-                    print(f"         3. または --use-bing / --use-chatgpt-search を使用")
-                    print(f"      現在のCX: {self.google_cx if self.google_cx else '未設定'}")
+                    self._log.error("      ❌ Google Custom Search Engine ID (CX) が無効です")
+                    self._log.info("      💡 対処法:")
+                    self._log.info("         1. Google Custom Search Engineを作成: https://programmablesearchengine.google.com/")
+                    self._log.info("         2. 環境変数 GOOGLE_CX に検索エンジンIDを設定")
+                    self._log.info("         3. または --use-bing / --use-chatgpt-search を使用")
+                    self._log.info("      現在のCX: %s", self.google_cx if self.google_cx else '未設定')
                 if logger:
                     logger.log_error("google_api_error", f"Google Custom Search API error: {response.status_code}", {
                         "search_query": search_query,
@@ -287,7 +393,7 @@ class GoogleCollector(SearchEngineCollector):
                     })
                         
         except Exception as e:
-            print(f"      ❌ API検索エラー: {e}")
+            self._log.error("      ❌ API検索エラー: %s", e)
             if logger:
                 logger.log_error("google_api_exception", str(e), {
                     "search_query": search_query,
@@ -296,14 +402,162 @@ class GoogleCollector(SearchEngineCollector):
         
         return search_results
     
+    def _api_call(self, query: str, num: int, site: Optional[str] = None) -> Tuple[Optional[Dict[str, Any]], Optional[requests.Response]]:
+        """
+        共通パラメータでCustom Search APIを呼び出す
+        
+        Args:
+            query: 検索クエリ
+            num: 取得件数（APIの上限を超える場合は上限に丸める）
+            site: 検索対象を限定するサイト（オプション）
+            
+        Returns:
+            (成功時のレスポンスJSON, HTTPレスポンス)のタプル
+        """
+        params = {
+            'key': self.google_api_key,
+            'cx': self.google_cx,
+            'q': query,
+            'num': min(num, GOOGLE_API_MAX_RESULTS_PER_REQUEST),  # APIは最大件数まで（Google制限）
+            'lr': 'lang_ja',  # 日本語結果を優先
+            'gl': 'jp',  # 日本からの検索として実行
+            'safe': 'off'  # セーフサーチオフ
+        }
+        if site:
+            params['siteSearch'] = site
+        
+        return self._request_api(params)
+    
+    def _request_api(self, params: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], Optional[requests.Response]]:
+        """
+        Custom Search APIへリクエストを送信（同じ検索条件の結果はキャッシュから返す）
+        
+        Args:
+            params: APIパラメータ
+            
+        Returns:
+            (成功時のレスポンスJSON, HTTPレスポンス)のタプル（キャッシュヒット時のHTTPレスポンスはNone）
+        """
+        cache_key = tuple(params.get(name) for name in _API_CACHE_KEY_PARAMS)
+        data = _API_RESPONSE_CACHE.get(cache_key)
+        if data is not None:
+            self._log.debug("      キャッシュ済みのAPI結果を使用: %s", params.get('q'))
+            return data, None
+        
+        self._api_bucket.acquire()
+        with self._api_semaphore:
+            response = self.session.get(self.api_base_url, params=params, timeout=REQUEST_TIMEOUT)
+        
+        if response.status_code != HTTP_STATUS_OK:
+            if response.status_code == HTTP_STATUS_TOO_MANY_REQUESTS:
+                self._api_bucket.penalize(self._rate_limit_penalty(
+                    self._api_bucket, parse_retry_after(response.headers.get('Retry-After'))
+                ))
+            return None, response
+        
+        data = orjson.loads(response.content)
+        _API_RESPONSE_CACHE.set(cache_key, data)
+        return data, response
+    
+    @staticmethod
+    def _rate_limit_penalty(bucket: TokenBucket, retry_after: Optional[float]) -> float:
+        """
+        429エラー時にバケットから差し引くトークン数を算出
+        
+        Retry-Afterがある場合は、その秒数だけ後続リクエストが止まるトークン数を差し引く。
+        
+        Args:
+            bucket: 対象のトークンバケット
+            retry_after: Retry-Afterヘッダーの秒数（ない場合はNone）
+            
+        Returns:
+            差し引くトークン数
+        """
+        if retry_after is None:
+            return GOOGLE_RATE_LIMIT_PENALTY_TOKENS
+        return max(GOOGLE_RATE_LIMIT_PENALTY_TOKENS, retry_after * bucket.rate)
+    
+    def _is_new_url(self, url: str, seen_urls: Optional[Set[Tuple[str, str]]]) -> bool:
+        """
+        未取得のURLかを判定し、未取得であれば取得済みとして記録
+        
+        Args:
+            url: 対象URL
+            seen_urls: 取得済みURLキー集合（Noneの場合は重複判定しない）
+            
+        Returns:
+            未取得のURLの場合True
+        """
+        if seen_urls is None:
+            return True
+        
+        # ホスト名の大文字小文字とクエリ文字列の違いは同一ページとみなす
+        parsed = urlparse(url)
+        key = (parsed.netloc.lower(), parsed.path)
+        
+        with self._seen_lock:
+            if key in seen_urls:
+                return False
+            seen_urls.add(key)
+            return True
+    
+    def _fetch_pages(self, urls: List[str], character_name: str = "", api_key: str = None, logger=None) -> List[Optional[SearchResult]]:
+        """
+        複数URLのページ内容を並列で取得
+        
+        Args:
+            urls: 対象URLのリスト
+            character_name: キャラクター名
+            api_key: OpenAI API Key
+            logger: ログ記録用
+            
+        Returns:
+            URLと同じ順序の抽出結果のリスト（取得失敗はNone）
+        """
+        if not urls:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(GOOGLE_PAGE_FETCH_CONCURRENCY, len(urls))) as executor:
+            return list(executor.map(
+                lambda url: self._extract_page_content(url, character_name, api_key, logger),
+                urls
+            ))
+    
+    def _create_snippet_result(self, url: str, title: str, snippet: str, speech_patterns: List[str]) -> SearchResult:
+        """
+        API検索結果のスニペットからSearchResultを作成
+        
+        Args:
+            url: 対象URL
+            title: 検索結果のタイトル
+            snippet: 検索結果のスニペット
+            speech_patterns: 話し方パターン
+            
+        Returns:
+            検索結果
+        """
+        return SearchResult(
+            url=url,
+            title=title,
+            description=snippet,
+            content=snippet,
+            domain=self._extract_domain(url),
+            content_length=len(snippet),
+            speech_patterns=speech_patterns,
+            source="google",
+            search_query=self._query_description
+        )
+    
     
-    def _search_single_pattern_fallback(self, search_query: str, max_results: int, character_name: str = "", api_key: str = None, logger=None) -> List[Dict[str, Any]]:
+    def _search_single_pattern_fallback(self, search_query: str, max_results: int, character_name: str = "", api_key: str = None, logger=None,
+                                        seen_urls: Optional[Set[Tuple[str, str]]] = None) -> List[SearchResult]:
         """
         単一の検索パターンを実行
         
         Args:
             search_query: 検索クエリ
             max_results: 最大取得結果数
+            seen_urls: 他パターンで取得済みのURLキー集合（重複URLはスキップ）
             
         Returns:
             検索結果のリスト
@@ -320,110 +574,24 @@ class GoogleCollector(SearchEngineCollector):
         for retry in range(max_retries):
             # パターン全体のタイムアウトチェック
             if time.time() - pattern_start_time > pattern_timeout:
-                print(f"    ⚠️ パターン全体がタイムアウト（{pattern_timeout}秒）のため処理を中断します")
+                self._log.warning("    ⚠️ パターン全体がタイムアウト（%s秒）のため処理を中断します", pattern_timeout)
                 break
             try:
-                # Google検索を実行（User-Agent設定付き）
-                search_urls = []
+                # 永続セッションで直接Google検索を実行し、結果URLを取得
+                search_urls = self._fallback_google_search(search_query, max_results)
+                search_urls = [url for url in search_urls if self._is_new_url(url, seen_urls)]
                 
-                # googlesearch-pythonライブラリに追加の設定を試行
-                try:
-                    # ランダムな待機時間でより人間らしい動作を模倣
-                    base_delay = max(self.delay * GOOGLE_FALLBACK_DELAY_MULTIPLIER, GOOGLE_MIN_DELAY)  # 最低待機時間
-                    
-                    print(f"      フォールバック検索実行中（{base_delay}秒間隔で慎重に取得）...")
-                    
-                    # googlesearch-pythonのUser-Agent設定を試行
-                    import googlesearch
-                    
-                    # より保守的な設定で検索（タイムアウト対策強化）
-                    search_timeout = False
-                    start_search_time = time.time()
-                    
-                    # タイムアウト付きの検索を実行
-                    search_results_iter = None
-                    try:
-                        # concurrent.futuresを使って検索にタイムアウトを設定
-                        import concurrent.futures
-                        import signal
-                        
-                        def search_with_timeout():
-                            try:
-                                return list(search(
-                                    search_query, 
-                                    num=max_results, 
-                                    stop=max_results, 
-                                    pause=base_delay,
-                                    lang='ja',  # 日本語検索を明示
-                                    safe='off',  # セーフサーチオフ
-                                    country='jp'  # 日本からの検索を明示
-                                ))
-                            except Exception as e:
-                                print(f"    検索関数内エラー: {e}")
-                                return []
-                        
-                        # 60秒のタイムアウトで検索実行
-                        with concurrent.futures.ThreadPoolExecutor(max_workers=THREAD_POOL_MAX_WORKERS_SINGLE) as executor:
-                            future = executor.submit(search_with_timeout)
-                            try:
-                                search_results = future.result(timeout=GOOGLE_SEARCH_TIMEOUT)
-                                print(f"      {len(search_results)}件のURLを取得")
-                                
-                                for url in search_results:
-                                    search_urls.append(url)
-                                    print(f"    URL取得: {url}")
-                                    
-                                    if len(search_urls) >= max_results:
-                                        break
-                                    
-                                    # 適度な待機
-                                    time.sleep(GOOGLE_URL_FETCH_DELAY)
-                                    
-                            except concurrent.futures.TimeoutError:
-                                print(f"    ⚠️ 検索処理がタイムアウト（{GOOGLE_SEARCH_TIMEOUT}秒）のため中断します")
-                                search_timeout = True
-                                future.cancel()
-                                
-                    except Exception as search_setup_error:
-                        print(f"    検索セットアップエラー: {search_setup_error}")
-                        search_timeout = True
-                    
-                    if search_timeout:
-                        print(f"    ⚠️ 検索がタイムアウトしました。取得済みURL: {len(search_urls)}件")
-                        if logger:
-                            logger.log_error("google_search_timeout", f"検索処理が{GOOGLE_SEARCH_TIMEOUT}秒でタイムアウト", {
-                                "search_query": search_query,
-                                "urls_collected": len(search_urls)
-                            })
-                        
-                except Exception as search_lib_error:
-                    print(f"    googlesearch-pythonライブラリエラー: {search_lib_error}")
-                    # フォールバック：直接Google検索を試行
-                    search_urls = self._fallback_google_search(search_query, max_results)
-                
-                # 各URLから情報を取得
-                for url in search_urls:
-                    try:
-                        # ページ内容を取得
-                        content_info = self._extract_page_content(url, character_name, api_key, logger)
-                        if content_info:
-                            search_results.append(content_info)
-                        
-                        # レート制限対策で大幅待機
-                        time.sleep(self.delay * GOOGLE_PAGE_DELAY_MULTIPLIER)
-                        
-                    except Exception as e:
-                        print(f"        ⚠️ URL取得エラー: {url[:50]}... - {e}")
-                        if logger:
-                            logger.log_error("url_extraction_error", str(e), {"url": url, "search_query": search_query})
-                        continue
+                # 各URLからページ内容を並列で取得
+                for content_info in self._fetch_pages(search_urls, character_name, api_key, logger):
+                    if content_info:
+                        search_results.append(content_info)
                 
                 # 成功した場合はループを抜ける
                 break
                         
             except Exception as search_error:
                 error_str = str(search_error)
-                print(f"検索パターン実行エラー ({search_query}): {search_error}")
+                self._log.warning("検索パターン実行エラー (%s): %s", search_query, search_error)
                 
                 # レート制限エラーの場合
                 if str(HTTP_STATUS_TOO_MANY_REQUESTS) in error_str or "Too Many Requests" in error_str or "429" in error_str:
@@ -435,26 +603,34 @@ class GoogleCollector(SearchEngineCollector):
                             "error_details": error_str
                         })
                         
-                    print(f"⚠️  Google検索で429エラー（レート制限）が発生しました")
-                    print(f"    検索クエリ: {search_query}")
-                    print(f"    試行回数: {retry + 1}/{max_retries}")
+                    self._log.warning("⚠️  Google検索で429エラー（レート制限）が発生しました")
+                    self._log.info("    検索クエリ: %s", search_query)
+                    self._log.info("    試行回数: %s/%s", retry + 1, max_retries)
+                    
+                    # サーバーがRetry-Afterを返した場合はその時間だけ待機する
+                    retry_after = getattr(search_error, 'details', {}).get("retry_after")
                     
                     if retry < max_retries - 1:
-                        # 429エラー時は特別に長い待機時間を設定
-                        wait_time = GOOGLE_429_EXTRA_DELAY + (retry_delay * (retry + 1))
-                        print(f"    429エラーのため{wait_time}秒待機してからリトライします...")
-                        print(f"    💡 頻繁にエラーが出る場合は以下をお試しください:")
-                        print(f"       - --use-bing フラグでBing検索を使用")
-                        print(f"       - --use-chatgpt-search フラグでChatGPT知識ベースを使用")
-                        print(f"       - Google Custom Search APIの設定（推奨）")
-                        time.sleep(wait_time)
+                        if retry_after is not None:
+                            wait_time = retry_after
+                        else:
+                            # Retry-Afterがない場合は特別に長い待機時間を設定
+                            wait_time = GOOGLE_429_EXTRA_DELAY + (retry_delay * (retry + 1))
+                        
+                        # 後続のパターンも同じクールダウンに従わせる（待機は次回リクエスト時に行う）
+                        self._scrape_window.cooldown(wait_time)
+                        self._log.warning("    429エラーのため%s秒待機してからリトライします...", wait_time)
+                        self._log.info("    💡 頻繁にエラーが出る場合は以下をお試しください:")
+                        self._log.info("       - --use-bing フラグでBing検索を使用")
+                        self._log.info("       - --use-chatgpt-search フラグでChatGPT知識ベースを使用")
+                        self._log.info("       - Google Custom Search APIの設定（推奨）")
                         continue
                     else:
-                        print(f"❌ 最大リトライ回数に達しました。検索パターンをスキップします: {search_query}")
-                        print(f"    💡 Google検索が継続的に失敗する場合の対処法:")
-                        print(f"       1. --use-bing フラグを使用してBing検索に切り替え")
-                        print(f"       2. --no-google フラグでWeb検索を完全に無効化")
-                        print(f"       3. 数時間後に再試行（Google側の制限リセット待ち）")
+                        self._log.error("❌ 最大リトライ回数に達しました。検索パターンをスキップします: %s", search_query)
+                        self._log.info("    💡 Google検索が継続的に失敗する場合の対処法:")
+                        self._log.info("       1. --use-bing フラグを使用してBing検索に切り替え")
+                        self._log.info("       2. --no-google フラグでWeb検索を完全に無効化")
+                        self._log.info("       3. 数時間後に再試行（Google側の制限リセット待ち）")
                         if logger:
                             logger.log_error("google_rate_limit_exceeded", f"Google検索の最大リトライ回数を超過", {
                                 "search_query": search_query,
@@ -471,7 +647,7 @@ class GoogleCollector(SearchEngineCollector):
     
     def _fallback_google_search(self, query: str, max_results: int) -> List[str]:
         """
-        googlesearch-pythonライブラリが失敗した場合のフォールバック検索
+        Custom Search APIが使えない場合のフォールバック検索（検索結果ページを直接取得）
         
         Args:
             query: 検索クエリ
@@ -479,47 +655,90 @@ class GoogleCollector(SearchEngineCollector):
             
         Returns:
             検索結果URLのリスト
+            
+        Raises:
+            SearchEngineError: レート制限（429）を受けた場合
         """
-        print(f"    フォールバック検索を実行中: {query}")
+        self._log.info("    フォールバック検索を実行中: %s", query)
         urls = []
         
         try:
             # 基本的なGoogle検索URL構築
-            import urllib.parse
             encoded_query = urllib.parse.quote_plus(query)
             google_url = f"https://www.google.com/search?q={encoded_query}&num={max_results}&hl=ja"
             
-            print(f"    直接Google検索URL: {google_url}")
+            self._log.debug("    直接Google検索URL: %s", google_url)
             
-            response = self.session.get(google_url, timeout=REQUEST_TIMEOUT)
+            # 初期化時のセッションを再利用してコネクションを使い回す
+            self._scrape_window.wait_until_allowed()
+            self._scrape_bucket.acquire()
+            response = self.session.get(
+                google_url,
+                headers={'Accept': 'text/html,application/xhtml+xml'},
+                timeout=REQUEST_TIMEOUT
+            )
             
             if response.status_code == HTTP_STATUS_OK:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Google検索結果のリンクを抽出
-                for link in soup.find_all('a'):
-                    href = link.get('href')
-                    if href and href.startswith('/url?q='):
-                        # Googleの内部URLから実際のURLを抽出
-                        actual_url = href.split('/url?q=')[1].split('&')[0]
-                        actual_url = urllib.parse.unquote(actual_url)
-                        
-                        # 有効なURLのみを追加
-                        if actual_url.startswith('http') and 'google.com' not in actual_url:
-                            urls.append(actual_url)
-                            if len(urls) >= max_results:
-                                break
+                urls = self._extract_serp_links(response.content, max_results)
                 
-                print(f"    フォールバック検索結果: {len(urls)}件")
+                self._log.info("    フォールバック検索結果: %s件", len(urls))
+            elif response.status_code == HTTP_STATUS_TOO_MANY_REQUESTS:
+                retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                self._scrape_bucket.penalize(self._rate_limit_penalty(self._scrape_bucket, retry_after))
+                raise SearchEngineError(
+                    f"Google検索でレート制限を受けました (HTTP {HTTP_STATUS_TOO_MANY_REQUESTS} Too Many Requests)",
+                    {
+                        "query": query,
+                        "status_code": response.status_code,
+                        "retry_after": retry_after
+                    }
+                )
             else:
-                print(f"    フォールバック検索失敗: HTTP {response.status_code}")
+                self._log.warning("    フォールバック検索失敗: HTTP %s", response.status_code)
                 
+        except SearchEngineError:
+            raise
         except Exception as e:
-            print(f"    フォールバック検索エラー: {e}")
+            self._log.warning("    フォールバック検索エラー: %s", e)
         
         return urls
     
-    def _extract_page_content(self, url: str, character_name: str = "", api_key: str = None, logger=None) -> Dict[str, Any]:
+    def _extract_serp_links(self, content: bytes, max_results: int) -> List[str]:
+        """
+        Google検索結果ページから結果URLを抽出（必要件数に達した時点で解析を打ち切る）
+        
+        Args:
+            content: 検索結果ページのHTML
+            max_results: 最大結果数
+            
+        Returns:
+            検索結果URLのリスト
+        """
+        urls = []
+        parser = etree.HTMLPullParser(events=('start',), tag='a')
+        
+        # 少しずつパーサーに渡し、その時点までに出現したリンクだけを処理する
+        for offset in range(0, len(content), HTTP_STREAM_CHUNK_SIZE):
+            parser.feed(content[offset:offset + HTTP_STREAM_CHUNK_SIZE])
+            
+            for _, element in parser.read_events():
+                href = element.get('href')
+                element.clear()
+                if not href or not href.startswith('/url?q='):
+                    continue
+                
+                # Googleの内部URLから実際のURLを抽出
+                actual_url = urllib.parse.unquote(href[len('/url?q='):].split('&', 1)[0])
+                
+                # 有効なURLのみを追加
+                if actual_url.startswith('http') and 'google.com' not in actual_url and actual_url not in urls:
+                    urls.append(actual_url)
+                    if len(urls) >= max_results:
+                        return urls
+        
+        return urls
+    
+    def _extract_page_content(self, url: str, character_name: str = "", api_key: str = None, logger=None) -> Optional[SearchResult]:
         """
         指定されたURLからページ内容を抽出
         
@@ -527,7 +746,7 @@ class GoogleCollector(SearchEngineCollector):
             url: 対象URL
             
         Returns:
-            抽出した内容の辞書
+            抽出した検索結果（取得できない場合はNone）
         """
         try:
             # URLの検証と修正
@@ -539,60 +758,71 @@ class GoogleCollector(SearchEngineCollector):
                 else:
                     url = 'https://' + url
             
+            # バイナリファイルやJavaScript専用サイトは取得しない
+            if self._is_unfetchable_url(url):
+                self._log.debug("        本文を取得できないURLのためスキップ: %s", url)
+                return None
+            
+            # 同じページの抽出結果がキャッシュにあれば再取得しない（コピーを返す）
+            cache_key = (url, character_name, self._openai is not None)
+            cached_result = _PAGE_CONTENT_CACHE.get(cache_key)
+            if cached_result is not None:
+                return replace(cached_result, search_query=self._query_description)
+            
             # 共通HTTPクライアントを使用してリクエストを実行
-            from utils.http_client import safe_http_get
-            response = safe_http_get(url, max_retries=MAX_RETRIES, timeout=REQUEST_TIMEOUT, logger=None, quiet=True)  # 一般的なHTTPエラーはログに記録せず、出力も抑制
+            self._log.debug("        ページ取得中: %s...", url[:50])
+            with self._page_semaphore:
+                # 本文はContent-Type確認後に上限バイト数まで読み込む
+                response = safe_http_get(url, max_retries=MAX_RETRIES, timeout=REQUEST_TIMEOUT, logger=None, quiet=True,
+                                         client=self._page_client, stream=True)  # 一般的なHTTPエラーはログに記録せず、出力も抑制
             
             if not response:
                 return None
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            # PDFや画像などHTML以外のレスポンスは解析しない
+            content_type = response.headers.get('Content-Type', '').lower()
+            if not any(html_type in content_type for html_type in GOOGLE_HTML_CONTENT_TYPES):
+                self._log.debug("        HTML以外のためスキップ (%s): %s", content_type or "不明", url)
+                response.close()
+                return None
+            
+            content = read_limited_content(response, GOOGLE_PAGE_MAX_BYTES)
+            root = self._parse_html(content, content_type)
             domain = self._extract_domain(url)  # ドメイン情報を先に取得
             
             # タイトルを取得
-            title = soup.find('title')
-            title_text = title.get_text().strip() if title else "不明"
+            title_text = (root.findtext('.//title') or "").strip() or "不明"
             
             # メタ説明を取得
-            meta_description = soup.find('meta', attrs={'name': 'description'})
-            description = meta_description.get('content', '') if meta_description else ''
+            meta_description = root.find('.//meta[@name="description"]')
+            description = meta_description.get('content', '') if meta_description is not None else ''
             
             # 本文テキストを抽出（主要な部分のみ）
             # スクリプトやスタイルを除去
-            for script in soup(["script", "style", "nav", "header", "footer"]):
-                script.decompose()
+            for element in list(root.iter(*_STRIP_TAGS)):
+                element.drop_tree()
             
-            # 本文テキストを取得
-            body_text = soup.get_text()
-            # 余分な空白を除去
-            lines = (line.strip() for line in body_text.splitlines())
-            chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-            body_text = ' '.join(chunk for chunk in chunks if chunk)
+            # 本文テキストを取得し、余分な空白を除去
+            body_text = _WHITESPACE_RE.sub(' ', root.text_content()).strip()
             
             # テキストを制限
             body_text = body_text[:GOOGLE_PAGE_LIMIT] if body_text else ""
             
-            # 口調・セリフ関連の文をChatGPT APIで抽出（API keyがある場合のみ）
-            speech_patterns = []
+            # 具体的なセリフをChatGPT APIで抽出（API keyがある場合のみ）
+            # 口調パターンはcollect_infoで全ページ分をまとめて抽出する
             character_quotes = []
-            if api_key and len(body_text.strip()) > GOOGLE_MIN_TEXT_LENGTH_FOR_API:  # 十分なテキストがある場合のみ
+            if self._openai and len(body_text.strip()) > GOOGLE_MIN_TEXT_LENGTH_FOR_API:  # 十分なテキストがある場合のみ
                 try:
-                    openai_client = OpenAIClient(api_key)
-                    speech_patterns = openai_client.extract_speech_patterns(body_text, character_name, logger)
-                    
-                    # 具体的なセリフも抽出
-                    quotes = openai_client.extract_character_quotes(
+                    character_quotes = self._openai.extract_character_quotes(
                         body_text, 
                         character_name, 
                         source="web",
                         source_url=url,
                         logger=logger
                     )
-                    # 辞書形式に変換してから追加（JSON保存のため）
-                    character_quotes.extend([quote.to_dict() for quote in quotes])
                     
                 except Exception as api_error:
-                    print(f"    API抽出スキップ ({domain}): {api_error}")
+                    self._log.warning("    API抽出スキップ (%s): %s", domain, api_error)
                     if logger:
                         logger.log_error("speech_pattern_api_error", str(api_error), {
                             "url": url,
@@ -600,36 +830,73 @@ class GoogleCollector(SearchEngineCollector):
                             "character_name": character_name,
                             "content_length": len(body_text)
                         })
-                    speech_patterns = []
                     character_quotes = []
             
-            result = {
-                "url": url,
-                "domain": domain,
-                "title": title_text,
-                "description": description,
-                "content": body_text,
-                "content_length": len(body_text),
-                "speech_patterns": speech_patterns
-            }
-            
-            # CharacterQuoteがある場合は追加
-            if character_quotes:
-                result["character_quotes"] = character_quotes
+            result = SearchResult(
+                url=url,
+                title=title_text,
+                description=description,
+                content=body_text,
+                domain=domain,
+                content_length=len(body_text),
+                speech_patterns=[],
+                character_quotes=character_quotes or None,
+                source="google",
+                search_query=self._query_description
+            )
+            _PAGE_CONTENT_CACHE.set(cache_key, result)
             
             return result
             
         except requests.RequestException as e:
-            print(f"HTTP取得エラー ({url}): {e}")
+            self._log.warning("HTTP取得エラー (%s): %s", url, e)
             if logger:
                 logger.log_error("http_request_error", str(e), {"url": url, "error_type": "RequestException"})
             return None
         except Exception as e:
-            print(f"コンテンツ抽出エラー ({url}): {e}")
+            self._log.warning("コンテンツ抽出エラー (%s): %s", url, e)
             if logger:
                 logger.log_error("content_extraction_error", str(e), {"url": url, "error_type": type(e).__name__})
             return None
     
+    def _is_unfetchable_url(self, url: str) -> bool:
+        """
+        本文テキストを取得できないURLかを判定
+        
+        Args:
+            url: 対象URL
+            
+        Returns:
+            バイナリファイルまたは除外対象ホスト（サブドメイン含む）の場合True
+        """
+        parsed = urlparse(url)
+        if os.path.splitext(parsed.path)[1].lower() in _BAD_EXTS:
+            return True
+        
+        host_parts = (parsed.hostname or '').split('.')
+        return any('.'.join(host_parts[i:]) in _SKIP_HOSTS for i in range(len(host_parts) - 1))
+    
+    def _parse_html(self, content: bytes, content_type: str) -> lxml.html.HtmlElement:
+        """
+        HTMLをlxmlで解析（Content-Typeに文字コードがあればそれを使用）
+        
+        Args:
+            content: レスポンス本文
+            content_type: Content-Typeヘッダーの値
+            
+        Returns:
+            解析したドキュメントのルート要素
+        """
+        charset_match = _CHARSET_RE.search(content_type)
+        if charset_match:
+            try:
+                parser = lxml.html.HTMLParser(encoding=charset_match.group(1))
+                return lxml.html.document_fromstring(content, parser=parser)
+            except LookupError:
+                pass  # 未知の文字コードの場合はlxmlの自動判定に任せる
+        
+        return lxml.html.document_fromstring(content)
+    
     def search_youtube_videos(self, name: str) -> List[str]:
         """
         YouTube動画を検索（動画URLを優先的に取得）
@@ -655,51 +922,68 @@ class GoogleCollector(SearchEngineCollector):
             # 除外キーワードを廃止（ユーザー要求により）
             
             youtube_urls = []
+            # トラッキング用パラメータ違いの同一動画を除外するため動画IDで重複判定
+            seen_video_ids: Set[str] = set()
             
             for search_query in search_queries:
                 if len(youtube_urls) >= YOUTUBE_MAX_URLS:
                     break
                     
-                print(f"YouTube検索中: {search_query}")
+                self._log.info("YouTube検索中: %s", search_query)
                 
                 try:
                     # Custom Search APIが利用可能な場合はAPIを使用
                     if self.google_api_key and self.google_cx:
                         api_urls = self._search_youtube_with_api(search_query)
                         for url in api_urls:
-                            if url not in youtube_urls:
+                            video_id = self._extract_video_id(url)
+                            if video_id not in seen_video_ids:
+                                seen_video_ids.add(video_id)
                                 youtube_urls.append(url)
-                                print(f"  - 動画URL発見（API）: {url}")
+                                self._log.debug("  - 動画URL発見（API）: %s", url)
                             if len(youtube_urls) >= YOUTUBE_MAX_URLS:
                                 break
                     else:
-                        # フォールバック: 従来の検索方法
-                        for url in search(search_query):
+                        # フォールバック: 検索結果ページを直接取得
+                        for url in self._fallback_google_search(search_query, YOUTUBE_MAX_URLS):
                             # 動画URLを収集
-                            if 'youtube.com/watch?v=' in url and url not in youtube_urls:
+                            if not _YT_WATCH.search(url):
+                                continue
+                            video_id = self._extract_video_id(url)
+                            if video_id not in seen_video_ids:
+                                seen_video_ids.add(video_id)
                                 youtube_urls.append(url)
-                                print(f"  - 動画URL発見: {url}")
+                                self._log.debug("  - 動画URL発見: %s", url)
                             
                             if len(youtube_urls) >= YOUTUBE_MAX_URLS:
                                 break
-                            time.sleep(YOUTUBE_SEARCH_DELAY)
                         
                 except Exception as search_error:
-                    print(f"YouTube検索実行エラー ({search_query}): {search_error}")
+                    self._log.warning("YouTube検索実行エラー (%s): %s", search_query, search_error)
                     # YouTube検索エラーはloggerに記録しない（通常のオペレーションではないため）
                     continue
-                
-                # クエリ間の大幅待機（レート制限対策）
-                time.sleep(self.delay * GOOGLE_YOUTUBE_DELAY_MULTIPLIER)
             
-            print(f"YouTube動画URL取得完了: {len(youtube_urls)}件")
+            self._log.info("YouTube動画URL取得完了: %s件", len(youtube_urls))
             return youtube_urls
             
         except Exception as e:
-            print(f"YouTube検索エラー: {e}")
+            self._log.warning("YouTube検索エラー: %s", e)
             # YouTube検索エラーはloggerに記録しない（通常のオペレーションではないため）
             return []
     
+    def _extract_video_id(self, url: str) -> str:
+        """
+        YouTube動画URLから動画IDを取得
+        
+        Args:
+            url: YouTube動画URL
+            
+        Returns:
+            動画ID（取得できない場合はURLそのもの）
+        """
+        match = _YT_WATCH.search(url)
+        return match.group(1) if match else url
+    
     def _search_youtube_with_api(self, search_query: str) -> List[str]:
         """
         Custom Search APIを使用してYouTube動画を検索
@@ -713,34 +997,21 @@ class GoogleCollector(SearchEngineCollector):
         youtube_urls = []
         
         try:
-            # Custom Search API パラメータ（YouTube検索）
-            params = {
-                'key': self.google_api_key,
-                'cx': self.google_cx,
-                'q': search_query,
-                'num': GOOGLE_YOUTUBE_API_RESULTS,  # APIでの取得件数
-                'lr': 'lang_ja',  # 日本語結果を優先
-                'gl': 'jp',  # 日本からの検索として実行
-                'safe': 'off',
-                'siteSearch': 'youtube.com'  # YouTube限定検索
-            }
-            
-            response = self.session.get(self.api_base_url, params=params, timeout=REQUEST_TIMEOUT)
+            # YouTube限定で検索
+            data, _ = self._api_call(search_query, GOOGLE_YOUTUBE_API_RESULTS, site='youtube.com')
             
-            if response.status_code == HTTP_STATUS_OK:
-                data = response.json()
-                
+            if data is not None:
                 if 'items' in data:
                     for item in data['items']:
                         url = item.get('link', '')
-                        if 'youtube.com/watch?v=' in url:
+                        if _YT_WATCH.search(url):
                             youtube_urls.append(url)
                         
                         if len(youtube_urls) >= YOUTUBE_MAX_URLS:
                             break
                             
         except Exception as e:
-            print(f"    YouTube API検索エラー: {e}")
+            self._log.warning("    YouTube API検索エラー: %s", e)
         
         return youtube_urls
     
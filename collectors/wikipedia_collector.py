@@ -2,34 +2,179 @@
 Wikipedia情報収集モジュール
 """
 
-import wikipedia
-import time
-from typing import Optional, Dict, Any, List
+import logging
+import orjson
+import os
+import re
+import requests
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple
 
 from core.interfaces import BaseCollector, CollectionResult, SearchResult
-from core.exceptions import WikipediaError
+from core.exceptions import WikipediaError, WikipediaPageNotFoundError, WikipediaDisambiguationError
 from config import (
     WIKIPEDIA_SUMMARY_LIMIT,
+    WIKIPEDIA_API_URL,
+    WIKIPEDIA_MAX_CONCURRENCY,
+    WIKIPEDIA_DISAMBIGUATION_CANDIDATES,
+    WIKIPEDIA_CANDIDATE_SCORE_CHARS,
+    WIKIPEDIA_EXTRACT_MAX_CHARS,
     SAMPLE_QUALITY_MIN_LENGTH,
     SAMPLE_PHRASES_MAX,
-    MULTIPLIER_DOUBLE
+    MULTIPLIER_DOUBLE,
+    REQUEST_TIMEOUT,
+    DEFAULT_USER_AGENT,
+    CACHE_DIR,
+    WIKIPEDIA_CACHE_TTL,
+    WIKIPEDIA_NEGATIVE_CACHE_TTL,
+    WIKIPEDIA_MEMORY_CACHE_MAX_SIZE
 )
+from utils.cache import DiskCache, TTLCache
 from utils.execution_logger import ExecutionLogger
+from utils.http_client import PooledSession, mount_pooled_adapter
+
+
+def _create_session() -> requests.Session:
+    """
+    MediaWiki API用のセッションを作成
+    
+    Returns:
+        コネクションプールを設定したセッション
+    """
+    session = mount_pooled_adapter(PooledSession())
+    session.headers.update({
+        'User-Agent': DEFAULT_USER_AGENT,
+        'Accept': 'application/json',
+        'Accept-Encoding': 'gzip, deflate'  # 日本語の本文は圧縮効率が高い
+    })
+    return session
+
+
+# 本文は結果で使う文字数だけAPI側で切り詰めて受け取る
+_EXTRACT_CHARS = min(int(WIKIPEDIA_SUMMARY_LIMIT * MULTIPLIER_DOUBLE), WIKIPEDIA_EXTRACT_MAX_CHARS)
+
+# コレクターは呼び出しごとに生成されるため、セッションはモジュール全体で共有して接続を使い回す
+_SESSION = _create_session()
+
+# 収集結果は(言語, 名前)ごとにディスクへ保存し、再実行時のリクエストを省く
+_RESULT_CACHE = DiskCache(os.path.join(CACHE_DIR, "wikipedia.sqlite3"))
+# 同一プロセス内での再検索はディスクも読まずにメモリから返す（返す結果は読み取り専用として扱う）
+_MEMORY_CACHE = TTLCache(max_size=WIKIPEDIA_MEMORY_CACHE_MAX_SIZE, ttl=WIKIPEDIA_CACHE_TTL)
+
+
+# キャラクター名によく含まれる要素（一般的なもののみ、casefold済み）
+_CHARACTER_INDICATORS = frozenset(indicator.casefold() for indicator in (
+    'キャラクター', 'character', 'アニメ', 'anime', 'マンガ', 'manga', '漫画',
+    'ゲーム', 'game', 'フィクション', 'fiction', '作品', '登場人物'
+))
+
+# 除外すべき要素（casefold済み）
+_EXCLUDE_INDICATORS = frozenset(indicator.casefold() for indicator in (
+    '聖書', '宗教', 'religion', '事件', '犯罪', 'crime', '政治', 'politics',
+    '企業', 'company', '会社', '組織', '団体', '学校', 'school', '大学'
+))
+
+# 指標ごとの重み（キャラクター指標は加点、除外指標は減点）
+_INDICATOR_WEIGHTS = {
+    **{indicator: 2 for indicator in _CHARACTER_INDICATORS},
+    **{indicator: -3 for indicator in _EXCLUDE_INDICATORS}
+}
+# 全指標を1回の走査で検出（先読みにより重なり合う指標も漏らさない）
+_INDICATOR_RE = re.compile(
+    '(?=(' + '|'.join(map(re.escape, sorted(_INDICATOR_WEIGHTS, key=len, reverse=True))) + '))'
+)
+
+
+@lru_cache(maxsize=1024)
+def _select_best_option(original_name: str, options: Tuple[str, ...]) -> str:
+    """
+    候補をスコアリングして最もキャラクターらしいものを選択（同じ入力の結果はキャッシュ）
+    
+    Args:
+        original_name: 元の検索名
+        options: 候補のタプル（空でないこと）
+        
+    Returns:
+        選択された候補
+    """
+    name_folded = original_name.casefold()
+    best_score = -1
+    best_option = options[0]  # デフォルトは最初の候補
+    
+    for option in options:
+        score = _score_text(name_folded, option.casefold())
+        if score > best_score:
+            best_score = score
+            best_option = option
+    
+    return best_option
+
+
+def _score_text(name_folded: str, text_folded: str) -> int:
+    """
+    テキストのキャラクターらしさをスコアリング
+    
+    Args:
+        name_folded: casefoldした検索名
+        text_folded: casefoldした対象テキスト
+        
+    Returns:
+        スコア
+    """
+    # キャラクター指標の加点・除外指標の減点（各指標は含まれていれば1回だけ数える）
+    found_indicators = {match.group(1) for match in _INDICATOR_RE.finditer(text_folded)}
+    score = sum(_INDICATOR_WEIGHTS[indicator] for indicator in found_indicators)
+    
+    # 元の名前が含まれるもの（キャラクター指標分と類似度分）
+    if name_folded in text_folded:
+        score += 2 + 5
+    
+    return score
 
 
 class WikipediaCollector(BaseCollector):
-    """Wikipedia情報を収集するクラス"""
+    """Wikipedia情報を収集するクラス（インスタンスは状態を持たないため、複数スレッドから共有可能）"""
     
-    def __init__(self, language: str = 'ja', **kwargs):
+    _instances: Dict[Tuple[str, bool], 'WikipediaCollector'] = {}
+    _instances_lock = threading.Lock()
+    
+    @classmethod
+    def get(cls, language: str = 'ja', use_cache: bool = True, **kwargs) -> 'WikipediaCollector':
+        """
+        言語・キャッシュ設定ごとに共有のインスタンスを取得
+        
+        Args:
+            language: Wikipedia言語設定 (デフォルト: 'ja')
+            use_cache: キャッシュ済みの結果を使うか
+            **kwargs: 初回生成時に渡すパラメータ
+            
+        Returns:
+            言語・キャッシュ設定ごとに1つのWikipediaCollector
+        """
+        instance_key = (language, use_cache)
+        with cls._instances_lock:
+            instance = cls._instances.get(instance_key)
+            if instance is None:
+                instance = cls(language=language, use_cache=use_cache, **kwargs)
+                cls._instances[instance_key] = instance
+            return instance
+    
+    def __init__(self, language: str = 'ja', use_cache: bool = True, **kwargs):
         """
         初期化
         
         Args:
             language: Wikipedia言語設定 (デフォルト: 'ja')
+            use_cache: キャッシュ済みの結果を使うか（Falseでも取得した結果はキャッシュに保存する）
         """
         super().__init__(**kwargs)
         self.language = language
-        wikipedia.set_lang(language)
+        self.use_cache = use_cache
+        self.api_url = WIKIPEDIA_API_URL.format(language=language)
+        self._session = _SESSION
+        self._log = logging.getLogger(__name__)
     
     def collect_info(self, name: str, logger: Optional[ExecutionLogger] = None, **kwargs) -> CollectionResult:
         """
@@ -42,78 +187,83 @@ class WikipediaCollector(BaseCollector):
         Returns:
             収集した情報
         """
-        start_time = time.time()
+        cache_key = f"{self.language}:{name}"
+        
+        cached_result = _MEMORY_CACHE.get(cache_key) if self.use_cache else None
+        if cached_result is None and self.use_cache:
+            try:
+                cached_result = _RESULT_CACHE.get(cache_key)
+            except Exception as e:
+                self._log.warning("      Wikipediaキャッシュ読み込みエラー: %s", e)
+            if cached_result is not None:
+                _MEMORY_CACHE.set(cache_key, cached_result, WIKIPEDIA_CACHE_TTL if cached_result.found else WIKIPEDIA_NEGATIVE_CACHE_TTL)
+        if cached_result is not None:
+            self._log.debug("      キャッシュ済みのWikipedia情報を使用: '%s'", name)
+            return cached_result
         
         try:
-            # まず検索してページを特定
-            print(f"      Wikipedia検索開始: '{name}'")
-            search_results = wikipedia.search(name, results=SAMPLE_QUALITY_MIN_LENGTH)
-            print(f"      {len(search_results)}件の検索結果")
+            # 検索とページ情報の取得を1回のリクエストで行う
+            self._log.debug("      Wikipedia検索開始: '%s'", name)
+            search_pages = self._search_pages(name, SAMPLE_QUALITY_MIN_LENGTH)
+            self._log.debug("      %s件の検索結果", len(search_pages))
             
-            if not search_results:
-                return self._create_error_result(
+            if not search_pages:
+                return self._cache_result(cache_key, self._create_error_result(
                     f"'{name}'に関するWikipediaページが見つかりませんでした",
                     query=name
-                )
+                ), WIKIPEDIA_NEGATIVE_CACHE_TTL)
             
             # 最適なページを選択
-            page_title = self._select_best_character_option(name, search_results)
-            print(f"      選択されたページ: '{page_title}'")
-            print(f"      ページ情報を取得中...")
-            page = wikipedia.page(page_title)
-            
-            result_data = {
-                "title": page.title,
-                "summary": page.summary[:WIKIPEDIA_SUMMARY_LIMIT],  # 最初の文字数
-                "content": page.content[:int(WIKIPEDIA_SUMMARY_LIMIT * MULTIPLIER_DOUBLE)],  # 要約の2倍の文字数
-                "url": page.url,
-                "categories": page.categories[:SAMPLE_PHRASES_MAX] if hasattr(page, 'categories') else []
-            }
-            print(f"      ✅ Wikipedia情報取得完了: '{page.title}'")
-            
-            return CollectionResult(
+            page_title = self._select_best_character_option(name, [page['title'] for page in search_pages])
+            self._log.debug("      選択されたページ: '%s'", page_title)
+            page = next(page for page in search_pages if page['title'] == page_title)
+            self._validate_page(page, page_title)
+            
+            result_data = self._build_result_data(page)
+            self._log.debug("      ✅ Wikipedia情報取得完了: '%s'", result_data['title'])
+            
+            return self._cache_result(cache_key, CollectionResult(
                 found=True,
                 error=None,
                 results=[result_data],
                 total_results=1
-            )
+            ), WIKIPEDIA_CACHE_TTL)
             
-        except wikipedia.exceptions.DisambiguationError as e:
+        except WikipediaDisambiguationError as e:
             # 曖昧さ回避ページの場合
+            options = e.details.get("options", [])
             try:
-                # キャラクター名らしい候補を選択
-                print(f"      曖昧さ回避ページを検出: {len(e.options)}件の候補")
-                best_option = self._select_best_character_option(name, e.options)
-                print(f"      選択されたページ: '{best_option}'")
-                page = wikipedia.page(best_option)
+                # 候補ページの導入部を1回のリクエストでまとめて取得し、本文も含めてキャラクターらしいものを選択
+                self._log.debug("      曖昧さ回避ページを検出: %s件の候補", len(options))
+                candidate_pages = self._fetch_candidate_pages(options[:WIKIPEDIA_DISAMBIGUATION_CANDIDATES])
+                if not candidate_pages:
+                    raise WikipediaPageNotFoundError("曖昧さ回避の候補ページを取得できませんでした")
+                
+                page = self._select_best_page(name, candidate_pages)
+                best_option = page['title']
+                self._log.debug("      選択されたページ: '%s'", best_option)
                 
-                result_data = {
-                    "title": page.title,
-                    "summary": page.summary[:WIKIPEDIA_SUMMARY_LIMIT],
-                    "content": page.content[:int(WIKIPEDIA_SUMMARY_LIMIT * MULTIPLIER_DOUBLE)],
-                    "url": page.url,
-                    "categories": page.categories[:SAMPLE_PHRASES_MAX] if hasattr(page, 'categories') else [],
-                    "other_options": e.options[:SAMPLE_QUALITY_MIN_LENGTH]  # 候補も記録
-                }
+                result_data = self._build_result_data(page)
+                result_data["other_options"] = options[:SAMPLE_QUALITY_MIN_LENGTH]  # 候補も記録
                 
-                return CollectionResult(
+                return self._cache_result(cache_key, CollectionResult(
                     found=True,
                     error=f"曖昧さ回避: {best_option} を選択しました",
                     results=[result_data],
                     total_results=1
-                )
+                ), WIKIPEDIA_CACHE_TTL)
             except Exception as inner_e:
                 return self._create_error_result(
                     f"曖昧さ回避エラー: {str(inner_e)}",
                     query=name,
-                    details={"disambiguation_options": e.options[:SAMPLE_QUALITY_MIN_LENGTH]}
+                    details={"disambiguation_options": options[:SAMPLE_QUALITY_MIN_LENGTH]}
                 )
                 
-        except wikipedia.exceptions.PageError:
-            return self._create_error_result(
+        except WikipediaPageNotFoundError:
+            return self._cache_result(cache_key, self._create_error_result(
                 f"'{name}'のWikipediaページが存在しません",
                 query=name
-            )
+            ), WIKIPEDIA_NEGATIVE_CACHE_TTL)
             
         except Exception as e:
             return self._create_error_result(
@@ -121,6 +271,45 @@ class WikipediaCollector(BaseCollector):
                 query=name
             )
     
+    def _cache_result(self, cache_key: str, result: CollectionResult, ttl: float) -> CollectionResult:
+        """
+        収集結果をメモリとディスクのキャッシュに保存（保存に失敗しても結果はそのまま返す）
+        
+        Args:
+            cache_key: キャッシュキー
+            result: 収集結果
+            ttl: 有効期限（秒）
+            
+        Returns:
+            渡された収集結果
+        """
+        _MEMORY_CACHE.set(cache_key, result, ttl)
+        try:
+            _RESULT_CACHE.set(cache_key, result, ttl)
+        except Exception as e:
+            self._log.warning("      Wikipediaキャッシュ保存エラー: %s", e)
+        return result
+    
+    def collect_many(self, names: List[str], logger: Optional[ExecutionLogger] = None,
+                     concurrency: int = WIKIPEDIA_MAX_CONCURRENCY) -> List[CollectionResult]:
+        """
+        複数の名前の情報を並列で収集
+        
+        Args:
+            names: 検索対象の名前のリスト
+            logger: 実行ログ記録用
+            concurrency: 同時に実行するリクエスト数
+            
+        Returns:
+            namesと同じ順序の収集結果のリスト
+        """
+        if not names:
+            return []
+        
+        # 処理はネットワーク待ちが中心のため、共有セッション上でスレッド並列化する
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(names))) as executor:
+            return list(executor.map(lambda name: self.collect_info(name, logger=logger), names))
+    
     def search_suggestions(self, name: str, limit: int = SAMPLE_PHRASES_MAX) -> List[str]:
         """
         検索候補を取得
@@ -133,11 +322,217 @@ class WikipediaCollector(BaseCollector):
             検索候補のリスト
         """
         try:
-            return wikipedia.search(name, results=limit)
+            return self._search(name, limit)
         except Exception as e:
-            print(f"検索候補取得エラー: {e}")
+            self._log.warning("検索候補取得エラー: %s", e)
             return []
     
+    def _query(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        MediaWiki APIのqueryアクションを実行
+        
+        Args:
+            params: action/format以外のAPIパラメータ
+            
+        Returns:
+            レスポンスの"query"部分
+            
+        Raises:
+            WikipediaError: APIがエラーを返した場合
+        """
+        query_params = {'action': 'query', 'format': 'json', 'formatversion': 2}
+        query_params.update(params)
+        
+        response = self._session.get(self.api_url, params=query_params, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        
+        if 'error' in data:
+            raise WikipediaError(
+                f"MediaWiki APIエラー: {data['error'].get('info', '')}",
+                details={"code": data['error'].get('code')}
+            )
+        
+        return data.get('query', {})
+    
+    def _search(self, name: str, limit: int) -> List[str]:
+        """
+        全文検索でページタイトルを取得
+        
+        Args:
+            name: 検索語
+            limit: 取得件数
+            
+        Returns:
+            ページタイトルのリスト
+        """
+        query = self._query({
+            'list': 'search',
+            'srsearch': name,
+            'srlimit': limit,
+            'srprop': ''  # タイトル以外の付加情報は不要
+        })
+        return [hit['title'] for hit in query.get('search', [])]
+    
+    def _search_pages(self, name: str, limit: int) -> List[Dict[str, Any]]:
+        """
+        検索結果のページ情報（導入部・カテゴリ・URL）を1回のリクエストで取得
+        
+        Args:
+            name: 検索語
+            limit: 取得件数
+            
+        Returns:
+            検索順に並べたAPIのページ情報のリスト
+        """
+        query = self._query({
+            'generator': 'search',
+            'gsrsearch': name,
+            'gsrlimit': limit,
+            'prop': 'extracts|categories|info|pageprops',
+            'exintro': 1,  # 複数ページの本文をまとめて取得できるのは導入部のみ
+            'exchars': _EXTRACT_CHARS,
+            'explaintext': 1,
+            'exlimit': 'max',
+            'inprop': 'url',
+            'ppprop': 'disambiguation',
+            'cllimit': 'max',
+            'clshow': '!hidden'
+        })
+        return sorted(query.get('pages', []), key=lambda page: page.get('index', 0))
+    
+    def _fetch_candidate_pages(self, titles: List[str]) -> List[Dict[str, Any]]:
+        """
+        複数の候補ページの導入部・カテゴリ・URLを1回のリクエストで取得
+        
+        Args:
+            titles: 候補ページタイトルのリスト
+            
+        Returns:
+            候補の順に並べた記事ページ情報のリスト（存在しないページと曖昧さ回避ページは除外）
+        """
+        if not titles:
+            return []
+        
+        query = self._query({
+            'prop': 'extracts|categories|info|pageprops',
+            'titles': '|'.join(titles),
+            'redirects': 1,
+            'exintro': 1,
+            'exchars': _EXTRACT_CHARS,
+            'explaintext': 1,
+            'exlimit': 'max',
+            'inprop': 'url',
+            'ppprop': 'disambiguation',
+            'cllimit': 'max',
+            'clshow': '!hidden'  # 保守用の隠しカテゴリは除外
+        })
+        
+        # 正規化・リダイレクト後のタイトルを元の候補に対応付ける
+        resolved_titles = {
+            mapping['from']: mapping['to']
+            for mapping in query.get('normalized', []) + query.get('redirects', [])
+        }
+        pages_by_title = {
+            page['title']: page
+            for page in query.get('pages', [])
+            if not page.get('missing') and not page.get('invalid') and 'disambiguation' not in page.get('pageprops', {})
+        }
+        
+        candidate_pages = []
+        for title in titles:
+            resolved_title = resolved_titles.get(title, title)
+            resolved_title = resolved_titles.get(resolved_title, resolved_title)  # 正規化後にリダイレクトされる場合
+            page = pages_by_title.pop(resolved_title, None)
+            if page:
+                candidate_pages.append(page)
+        
+        return candidate_pages
+    
+    def _select_best_page(self, original_name: str, pages: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        タイトルと導入部の内容から最もキャラクターらしいページを選択
+        
+        Args:
+            original_name: 元の検索名
+            pages: 候補の記事ページ情報のリスト（空でないこと）
+            
+        Returns:
+            選択されたページ情報（同点の場合は候補順で先のもの）
+        """
+        name_folded = original_name.casefold()
+        return max(pages, key=lambda page: _score_text(
+            name_folded,
+            f"{page['title']}\n{page.get('extract', '')[:WIKIPEDIA_CANDIDATE_SCORE_CHARS]}".casefold()
+        ))
+    
+    def _validate_page(self, page: Dict[str, Any], title: str):
+        """
+        取得したページが通常の記事であることを確認
+        
+        Args:
+            page: APIのページ情報
+            title: 要求したページタイトル
+            
+        Raises:
+            WikipediaPageNotFoundError: ページが存在しない場合
+            WikipediaDisambiguationError: 曖昧さ回避ページの場合
+        """
+        if not page or page.get('missing') or page.get('invalid'):
+            raise WikipediaPageNotFoundError(
+                f"'{title}'のWikipediaページが存在しません",
+                details={"title": title}
+            )
+        
+        if 'disambiguation' in page.get('pageprops', {}):
+            raise WikipediaDisambiguationError(
+                f"'{page['title']}'は曖昧さ回避ページです",
+                details={"title": page['title'], "options": self._fetch_disambiguation_options(page['title'])}
+            )
+    
+    def _fetch_disambiguation_options(self, title: str) -> List[str]:
+        """
+        曖昧さ回避ページからリンク先の候補を取得
+        
+        Args:
+            title: 曖昧さ回避ページのタイトル
+            
+        Returns:
+            候補ページタイトルのリスト
+        """
+        query = self._query({
+            'prop': 'links',
+            'titles': title,
+            'plnamespace': 0,
+            'pllimit': 'max'
+        })
+        pages = query.get('pages', [])
+        return [link['title'] for link in pages[0].get('links', [])] if pages else []
+    
+    def _build_result_data(self, page: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        APIのページ情報を結果辞書に変換
+        
+        Args:
+            page: APIのページ情報
+            
+        Returns:
+            結果辞書
+        """
+        content = page.get('extract', '')
+        # 最初の見出しより前の導入部を要約として扱う
+        summary = content.split('\n==', 1)[0].strip()
+        # "Category:" 接頭辞を除いたカテゴリ名
+        categories = [category['title'].split(':', 1)[-1] for category in page.get('categories', [])[:SAMPLE_PHRASES_MAX]]
+        
+        return {
+            "title": page['title'],
+            "summary": summary[:WIKIPEDIA_SUMMARY_LIMIT],  # 最初の文字数
+            "content": content[:int(WIKIPEDIA_SUMMARY_LIMIT * MULTIPLIER_DOUBLE)],  # 要約の2倍の文字数
+            "url": page.get('fullurl', ''),
+            "categories": categories
+        }
+    
     def _select_best_character_option(self, original_name: str, options: List[str]) -> str:
         """
         曖昧さ回避の候補からキャラクターらしいものを選択
@@ -152,42 +547,4 @@ class WikipediaCollector(BaseCollector):
         if not options:
             return original_name
         
-        # キャラクター名によく含まれる要素（一般的なもののみ）
-        character_indicators = [
-            original_name,  # 元の名前が含まれるもの
-            'キャラクター', 'character', 'アニメ', 'anime', 'マンガ', 'manga', '漫画',
-            'ゲーム', 'game', 'フィクション', 'fiction', '作品', '登場人物'
-        ]
-        
-        # 除外すべき要素
-        exclude_indicators = [
-            '聖書', '宗教', 'religion', '事件', '犯罪', 'crime', '政治', 'politics',
-            '企業', 'company', '会社', '組織', '団体', '学校', 'school', '大学'
-        ]
-        
-        best_score = -1
-        best_option = options[0]  # デフォルトは最初の候補
-        
-        for option in options[:SAMPLE_PHRASES_MAX]:  # 上位件数のみチェック
-            score = 0
-            option_lower = option.lower()
-            
-            # キャラクター指標の加点
-            for indicator in character_indicators:
-                if indicator.lower() in option_lower:
-                    score += 2
-            
-            # 除外指標の減点
-            for exclude in exclude_indicators:
-                if exclude.lower() in option_lower:
-                    score -= 3
-            
-            # 元の名前との類似度
-            if original_name.lower() in option_lower:
-                score += 5
-            
-            if score > best_score:
-                best_score = score
-                best_option = option
-        
-        return best_option
\ No newline at end of file
+        return _select_best_option(original_name, tuple(options[:SAMPLE_PHRASES_MAX]))  # 上位件数のみチェック
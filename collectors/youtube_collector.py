@@ -2,41 +2,129 @@
 YouTube字幕収集モジュール
 """
 
+import logging
+import os
 import re
+import threading
 import random
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+import openai
 from youtube_transcript_api import YouTubeTranscriptApi
-from youtube_transcript_api.formatters import TextFormatter
-from typing import List, Dict, Any
-from urllib.parse import urlparse, parse_qs
+from typing import List, Dict, Any, Tuple, Callable, Iterator, Optional
 from core.interfaces import CharacterQuote
 from config import (
     YOUTUBE_MAX_VIDEOS, YOUTUBE_MAX_TRANSCRIPTS, YOUTUBE_TRANSCRIPT_LIMIT,
     SAMPLE_PHRASES_MAX, SAMPLE_PHRASE_MIN_LENGTH, SAMPLE_PHRASE_MAX_LENGTH,
     SAMPLE_QUALITY_MIN_LENGTH, SAMPLE_QUALITY_MAX_LENGTH,
     CHATGPT_FILTER_TEXT_LIMIT, OPENAI_MODEL, OPENAI_FILTER_MAX_TOKENS,
-    OPENAI_FILTER_TEMPERATURE, get_search_patterns,
+    OPENAI_FILTER_TEMPERATURE,
     YOUTUBE_VIDEO_ID_DISPLAY_LENGTH, YOUTUBE_PREVIEW_TEXT_LENGTH,
     YOUTUBE_SAMPLE_DISPLAY_LIMIT, YOUTUBE_MIN_SENTENCE_LENGTH,
     YOUTUBE_MAX_SINGLE_CHAR_LENGTH, YOUTUBE_MAX_PERIOD_COUNT,
     YOUTUBE_FILTER_PHRASE_LIMIT, YOUTUBE_ANALYSIS_TEXT_LIMIT,
-    YOUTUBE_ANALYSIS_MAX_TOKENS, REGEX_JAPANESE_CHAR_MIN, REGEX_JAPANESE_CHAR_MAX
+    YOUTUBE_ANALYSIS_MAX_TOKENS, REGEX_JAPANESE_CHAR_MIN, REGEX_JAPANESE_CHAR_MAX,
+    CACHE_DIR, YOUTUBE_TRANSCRIPT_CACHE_TTL, YOUTUBE_TRANSCRIPT_MEMORY_CACHE_MAX_SIZE,
+    YOUTUBE_TRANSCRIPT_FETCH_CONCURRENCY, YOUTUBE_FILTER_CONCURRENCY
 )
+from utils.cache import DiskCache, TTLCache
+
+
+# 様々なYouTube URLパターンに対応した動画ID抽出（watch・短縮URL・埋め込み・ショートを1回の検索で判定）
+# 動画IDは11文字固定なので文字種と長さを限定し、不正なIDは字幕取得前に弾く
+_VIDEO_ID_RE = re.compile(
+    r'(?:youtube\.com/(?:watch\?(?:[^#\s]*?&)?v=|embed/|shorts/)|youtu\.be/)([A-Za-z0-9_-]{11})'
+)
+
+# サンプルフレーズ抽出用
+_NOISE_RE = re.compile(r'\[.*?\]')  # [音楽]、[拍手]などの記号
+# 文末記号をすべて「。」に揃えてからstr.splitで分割する
+_SENTENCE_END_TABLE = str.maketrans('！？.!?', '。。。。。')
+# 効果音で始まる文と、短いひらがなだけの相槌を1回の照合で除外
+_JUNK_SENTENCE_RE = re.compile(
+    rf'^(?:[音楽拍手効果音]+|[あ-ん]{{{REGEX_JAPANESE_CHAR_MIN},{REGEX_JAPANESE_CHAR_MAX}}}$)'
+)
+_FILLER_SENTENCES = frozenset(['', ' ', 'うん', 'そう', 'はい', 'えー', 'あー'])
+# 重複判定の正規化で空白文字を削除する変換表（Unicodeの空白文字はU+3000以下にすべて含まれる）
+_WHITESPACE_DELETE_TABLE = dict.fromkeys(code for code in range(0x3001) if chr(code).isspace())
+_WHITESPACE_RE = re.compile(r'\s')
+
+# サンプル品質チェック用
+# 単純な文字クラスの判定は正規表現を使わず集合の所属判定で行う
+_REPEATED_TEXT_PREFIX_CHARS = frozenset('同じ文章の繰り返し')
+_MEANINGLESS_CHARS = frozenset('あいうえおかきくけこ')
+_SOUND_EFFECT_PREFIX_CHARS = frozenset('音楽効果音')
+_BAD_SUBSTRINGS = ('詰んだろうが', '教会の常識')  # 明らかに間違った文を除外
+
+# 言語特徴分析の応答から "項目1: 内容" 形式の行を取り出す
+_ANALYSIS_ITEM_RE = re.compile(r'^項目\s*(\d+)\s*[:：](.*)$')
+
+# 字幕の優先順位（言語コード, 自動生成か）。日本語→英語の順に、同じ言語では手動作成の字幕を優先する
+_TRANSCRIPT_PREFERENCE = (
+    ('ja', False), ('ja', True),
+    ('jp', False), ('jp', True),
+    ('en', False), ('en', True),
+)
+
+# 発言抽出用のシステムプロンプト（キャラクターに依存しない固定文）
+_FILTER_SYSTEM_PROMPT = "あなたは字幕から特定キャラクターの発言を抽出する専門家です。キャラクターの特徴的な口調や語尾を正確に識別し、他のキャラクターや関係ない発言は確実に除外してください。"
+
+# 字幕は動画IDごとにディスクへ保存し、再実行時のYouTubeへの問い合わせを省く
+# （v2: ノイズ除去済みのテキストを保存する形式。除去前の旧キャッシュとは混在させない）
+_TRANSCRIPT_DISK_CACHE = DiskCache(os.path.join(CACHE_DIR, "youtube_transcripts_v2.sqlite3"))
+_TRANSCRIPT_MEMORY_CACHE = TTLCache(max_size=YOUTUBE_TRANSCRIPT_MEMORY_CACHE_MAX_SIZE, ttl=YOUTUBE_TRANSCRIPT_CACHE_TTL)
+
+
+def _join_limited(text_list: List[str], limit: int) -> str:
+    """
+    テキストを空白区切りで結合し、先頭から制限文字数までを返す
+    
+    ' '.join(text_list)[:limit] と同じ結果になるが、制限文字数に達した時点で打ち切り全文は結合しない。
+    
+    Args:
+        text_list: テキストのリスト
+        limit: 最大文字数
+        
+    Returns:
+        結合したテキスト
+    """
+    text_parts = []
+    remaining = limit
+    for text in text_list:
+        if len(text) >= remaining:
+            text_parts.append(text[:remaining])
+            break
+        text_parts.append(text)
+        remaining -= len(text) + 1  # 区切りの空白分
+    return ' '.join(text_parts)
 
 
 class YouTubeCollector:
     """YouTube動画の字幕を収集するクラス"""
     
-    def __init__(self):
-        """初期化"""
-        self.formatter = TextFormatter()
+    def __init__(self, use_cache: bool = True):
+        """
+        初期化
+        
+        Args:
+            use_cache: キャッシュ済みの字幕を使うか（Falseでも取得した字幕はキャッシュに保存する）
+        """
+        self.use_cache = use_cache
+        self._log = logging.getLogger(__name__)
+        # OpenAI APIクライアント（API Keyごとに1つだけ生成して使い回す）
+        self._openai_clients: Dict[str, Any] = {}
     
-    def collect_info(self, youtube_urls: List[str], max_videos: int = None, logger=None, character_info: Dict = None, api_key: str = None) -> Dict[str, Any]:
+    def collect_info(self, youtube_urls: List[str], max_videos: int = None, logger=None, character_info: Dict = None, api_key: str = None, extract_samples: bool = True,
+                     cancel_event: Optional[threading.Event] = None) -> Dict[str, Any]:
         """
         YouTube URLから字幕情報を収集
         
         Args:
             youtube_urls: YouTube URLのリスト
             max_videos: 処理する最大動画数
+            extract_samples: サンプルフレーズを抽出するか（字幕をそのままfilter_character_speechに渡す場合はFalse）
+            cancel_event: セットされたら未着手の字幕取得を取り消して打ち切るイベント（タイムアウト用）
             
         Returns:
             収集した字幕情報の辞書
@@ -54,70 +142,86 @@ class YouTubeCollector:
                     "sample_phrases": []
                 }
             
-            print(f"  {len(youtube_urls)}個の動画から字幕を収集中（最大{max_videos}動画）...")
+            self._log.info("  %s個の動画から字幕を収集中（最大%s動画）...", len(youtube_urls), max_videos)
             
             transcripts = []
             all_text = []
-            total_videos = min(len(youtube_urls), max_videos)
             
+            video_ids = []
             for i, url in enumerate(youtube_urls[:max_videos]):
                 video_id = self._extract_video_id(url)
                 if not video_id:
-                    print(f"  動画{i+1}: 無効なURL - {url}")
+                    self._log.info("  動画%s: 無効なURL - %s", i+1, url)
                     continue
+                video_ids.append(video_id)
+            
+            # 字幕取得はネットワーク待ちが中心のため並列で実行し、完了した順に処理する
+            with ThreadPoolExecutor(max_workers=YOUTUBE_TRANSCRIPT_FETCH_CONCURRENCY) as executor:
+                futures = [executor.submit(self._get_video_transcript, video_id) for video_id in video_ids]
                 
-                print(f"  動画{i+1}/{total_videos} (ID: {video_id[:YOUTUBE_VIDEO_ID_DISPLAY_LENGTH]}): 字幕取得中...")
-                transcript_info = self._get_video_transcript(video_id)
-                
-                if transcript_info["found"]:
-                    transcripts.append(transcript_info)
-                    all_text.append(transcript_info["text"])
-                    # 取得したテキストの一部を表示（デバッグ用）
-                    preview = transcript_info["text"][:YOUTUBE_PREVIEW_TEXT_LENGTH].replace('\n', ' ')
-                    print(f"    ✅ 字幕取得成功 ({transcript_info['word_count']}語, {transcript_info['language']})")
-                    print(f"    プレビュー: {preview}...")
-                else:
-                    print(f"    ❌ 字幕取得失敗: {transcript_info['error']}")
+                for completed, future in enumerate(as_completed(futures), 1):
+                    transcript_info = future.result()
+                    video_id = transcript_info["video_id"]
+                    self._log.info("  動画%s/%s (ID: %s):", completed, len(video_ids), video_id[:YOUTUBE_VIDEO_ID_DISPLAY_LENGTH])
+                    
+                    if transcript_info["found"]:
+                        transcripts.append(transcript_info)
+                        all_text.append(transcript_info["text"])
+                        self._log.info("    ✅ 字幕取得成功 (%s語, %s)", transcript_info['word_count'], transcript_info['language'])
+                        # 取得したテキストの一部を表示（デバッグ用、出力しない場合はプレビューも作らない）
+                        if self._log.isEnabledFor(logging.DEBUG):
+                            preview = transcript_info["text"][:YOUTUBE_PREVIEW_TEXT_LENGTH].replace('\n', ' ')
+                            self._log.debug("    プレビュー: %s...", preview)
+                    else:
+                        self._log.error("    ❌ 字幕取得失敗: %s", transcript_info['error'])
+                    
+                    # 字幕が十分取得できたら未着手の取得を取り消して早期終了
+                    if len(transcripts) >= YOUTUBE_MAX_TRANSCRIPTS:
+                        self._log.info("  十分な字幕データを取得しました (%s動画)", len(transcripts))
+                        for pending in futures:
+                            pending.cancel()
+                        break
+                    
+                    # 呼び出し側でタイムアウトした場合も同様に打ち切る
+                    if cancel_event is not None and cancel_event.is_set():
+                        for pending in futures:
+                            pending.cancel()
+                        break
+            
+            # サンプルフレーズを抽出（不要な場合は抽出・品質チェックとも省略）
+            sample_phrases = []
+            quality_checked_phrases = []
+            if extract_samples:
+                self._log.info("\n  📝 サンプルフレーズ抽出中...")
+                sample_phrases = self._extract_sample_phrases(all_text)
                 
-                # 字幕が十分取得できたら早期終了
-                if len(transcripts) >= YOUTUBE_MAX_TRANSCRIPTS:
-                    print(f"  十分な字幕データを取得しました ({len(transcripts)}動画)")
-                    break
-            
-            # サンプルフレーズを抽出
-            print(f"\n  📝 サンプルフレーズ抽出中...")
-            sample_phrases = self._extract_sample_phrases(all_text)
-            
-            # サンプル品質チェック
-            quality_checked_phrases = self._check_sample_quality(sample_phrases)
+                # サンプル品質チェック
+                quality_checked_phrases = self._check_sample_quality(sample_phrases)
             
             # 検索パターン相当の言語特徴抽出（API keyがある場合）
             pattern_analysis = {}
             if api_key and all_text:
-                print(f"  🤔 言語パターン分析中 (ChatGPT API)...")
+                self._log.info("  🤔 言語パターン分析中 (ChatGPT API)...")
                 pattern_analysis = self._analyze_speech_patterns(all_text, character_info.get("name", ""), api_key)
             
-            print(f"  📝 サンプルフレーズ抽出: {len(sample_phrases)}個 → 品質チェック後: {len(quality_checked_phrases)}個")
-            
-            # デバッグ用：抽出されたフレーズの一部を表示
-            if quality_checked_phrases:
-                print(f"  📋 抽出されたサンプル（最初の{YOUTUBE_SAMPLE_DISPLAY_LIMIT}個）:")
-                for i, phrase in enumerate(quality_checked_phrases[:YOUTUBE_SAMPLE_DISPLAY_LIMIT]):
-                    print(f"    {i+1}. {phrase}")
-            else:
-                print("  ⚠️ サンプルフレーズが抽出されませんでした")
+            if extract_samples:
+                self._log.info("  📝 サンプルフレーズ抽出: %s個 → 品質チェック後: %s個", len(sample_phrases), len(quality_checked_phrases))
+                
+                # デバッグ用：抽出されたフレーズの一部を表示
+                if not quality_checked_phrases:
+                    self._log.warning("  ⚠️ サンプルフレーズが抽出されませんでした")
+                elif self._log.isEnabledFor(logging.DEBUG):
+                    self._log.debug("  📋 抽出されたサンプル（最初の%s個）:", YOUTUBE_SAMPLE_DISPLAY_LIMIT)
+                    for i, phrase in enumerate(quality_checked_phrases[:YOUTUBE_SAMPLE_DISPLAY_LIMIT]):
+                        self._log.debug("    %s. %s", i+1, phrase)
             
             # CharacterQuoteオブジェクトとしてセリフを整理
             character_quotes = []
+            character_name = character_info.get("name", "") if character_info else ""
             for phrase in quality_checked_phrases:
                 # YouTubeソースは基本的に信頼性は中程度
-                # キャラクター名がセリフに含まれるか、APIでフィルタリングされている場合は信頼性を上げる
-                confidence = 0.5  # デフォルト信頼性
-                character_name = character_info.get("name", "") if character_info else ""
-                
                 # キャラクター名がセリフに含まれる場合は信頼性アップ
-                if character_name and character_name in phrase:
-                    confidence = 0.8
+                confidence = 0.8 if character_name and character_name in phrase else 0.5
                 
                 quote = CharacterQuote(
                     text=phrase,
@@ -142,13 +246,10 @@ class YouTubeCollector:
             }
             
         except Exception as e:
-            import traceback
             error_msg = f"YouTube字幕収集エラー: {str(e)}"
-            error_traceback = traceback.format_exc()
             
-            print(f"❌ YouTube字幕収集エラーの詳細:")
-            print(f"エラー: {error_msg}")
-            print(f"トレースバック:\n{error_traceback}")
+            # トレースバックも併せて出力
+            self._log.exception("❌ %s", error_msg)
             
             return {
                 "found": False,
@@ -169,24 +270,48 @@ class YouTubeCollector:
             動画ID（見つからない場合はNone）
         """
         try:
-            # 様々なYouTube URLパターンに対応
-            patterns = [
-                r'(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/embed/)([^&\n?#]+)',
-                r'youtube\.com/watch\?.*v=([^&\n?#]+)'
-            ]
-            
-            for pattern in patterns:
-                match = re.search(pattern, url)
-                if match:
-                    return match.group(1)
-            
-            return None
+            match = _VIDEO_ID_RE.search(url)
+            return match.group(1) if match else None
         except Exception:
             return None
     
     def _get_video_transcript(self, video_id: str) -> Dict[str, Any]:
         """
-        指定された動画IDの字幕を取得
+        指定された動画IDの字幕を取得（キャッシュがあればそれを返す）
+        
+        Args:
+            video_id: YouTube動画ID
+            
+        Returns:
+            字幕情報の辞書
+        """
+        if self.use_cache:
+            transcript_info = _TRANSCRIPT_MEMORY_CACHE.get(video_id)
+            if transcript_info is None:
+                try:
+                    transcript_info = _TRANSCRIPT_DISK_CACHE.get(video_id)
+                except Exception as e:
+                    self._log.warning("    字幕キャッシュ読み込みエラー: %s", e)
+                if transcript_info is not None:
+                    _TRANSCRIPT_MEMORY_CACHE.set(video_id, transcript_info)
+            if transcript_info is not None:
+                return dict(transcript_info)
+        
+        transcript_info = self._fetch_video_transcript(video_id)
+        
+        # 取得できなかった結果は一時的なエラーの可能性があるため保存しない
+        if transcript_info["found"]:
+            _TRANSCRIPT_MEMORY_CACHE.set(video_id, transcript_info)
+            try:
+                _TRANSCRIPT_DISK_CACHE.set(video_id, transcript_info, YOUTUBE_TRANSCRIPT_CACHE_TTL)
+            except Exception as e:
+                self._log.warning("    字幕キャッシュ保存エラー: %s", e)
+        
+        return dict(transcript_info)
+    
+    def _fetch_video_transcript(self, video_id: str) -> Dict[str, Any]:
+        """
+        指定された動画IDの字幕をYouTubeから取得
         
         Args:
             video_id: YouTube動画ID
@@ -198,20 +323,13 @@ class YouTubeCollector:
             # 利用可能な字幕言語を取得
             transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
             
-            # 日本語字幕を優先的に取得
-            transcript = None
-            try:
-                transcript = transcript_list.find_transcript(['ja', 'jp'])
-            except:
-                # 日本語がない場合は英語を試す
-                try:
-                    transcript = transcript_list.find_transcript(['en'])
-                except:
-                    # 自動生成字幕を試す
-                    try:
-                        transcript = transcript_list.find_generated_transcript(['ja', 'jp', 'en'])
-                    except:
-                        pass
+            # 日本語字幕を優先的に取得（例外による分岐を避け、一覧を1回走査して優先順に選ぶ）
+            candidates = {
+                (t.language_code, t.is_generated): t for t in transcript_list
+            }
+            transcript = next(
+                (candidates[key] for key in _TRANSCRIPT_PREFERENCE if key in candidates), None
+            )
             
             if not transcript:
                 return {
@@ -225,21 +343,25 @@ class YouTubeCollector:
             # 字幕データを取得
             transcript_data = transcript.fetch()
             
-            # テキストを結合（正しい属性アクセス）
+            # テキストを結合（制限文字数に達した時点で打ち切り、長い動画でも全文を連結しない）
+            # [音楽]、[拍手]などの記号は字幕の行をまたがないため、結合前に行ごとに除去する
             text_parts = []
+            remaining = YOUTUBE_TRANSCRIPT_LIMIT
+            get_text = self._resolve_snippet_text_getter(transcript_data)
             for entry in transcript_data:
-                if hasattr(entry, 'text'):
-                    text_parts.append(entry.text)
-                elif isinstance(entry, dict) and 'text' in entry:
-                    text_parts.append(entry['text'])
-                else:
-                    # FetchedTranscriptSnippetオブジェクトの場合
-                    text_parts.append(str(entry))
-            
-            full_text = ' '.join(text_parts)
+                text = get_text(entry)
+                if '[' in text:
+                    if text.startswith('[') and text.endswith(']') and text.find(']') == len(text) - 1:
+                        continue  # 記号だけの行
+                    text = _NOISE_RE.sub('', text)
+                # 制限文字数を超える行は超えた分を切り捨てて打ち切る（結合後に全体をスライスし直さない）
+                if len(text) >= remaining:
+                    text_parts.append(text[:remaining])
+                    break
+                text_parts.append(text)
+                remaining -= len(text) + 1  # 区切りの空白分
             
-            # テキストを制限
-            limited_text = full_text[:YOUTUBE_TRANSCRIPT_LIMIT] if full_text else ""
+            limited_text = ' '.join(text_parts)
             
             return {
                 "found": True,
@@ -260,12 +382,47 @@ class YouTubeCollector:
                 "language": None
             }
     
+    def _resolve_snippet_text_getter(self, transcript_data) -> Callable[[Any], str]:
+        """
+        字幕データの各要素からテキストを取り出す関数を決定
+        
+        1本の動画の字幕データは要素の型がすべて同じなので、先頭要素の型から一度だけ決める。
+        
+        Args:
+            transcript_data: 字幕データ（FetchedTranscriptまたは辞書のリスト）
+            
+        Returns:
+            要素を受け取りテキストを返す関数
+        """
+        first = next(iter(transcript_data), None)
+        if first is None:
+            return str
+        if hasattr(first, 'text'):
+            return attrgetter('text')
+        if isinstance(first, dict) and 'text' in first:
+            return itemgetter('text')
+        return str
+    
+    @staticmethod
+    def _iter_sentences(text_list: List[str]) -> Iterator[str]:
+        """
+        字幕テキストを1本ずつ文に分割して順に返す（全字幕を結合した文字列は作らない）
+        
+        Args:
+            text_list: ノイズ除去済みの字幕テキストのリスト
+            
+        Returns:
+            文のイテレータ
+        """
+        for text in text_list:
+            yield from text.translate(_SENTENCE_END_TABLE).split('。')
+    
     def _extract_sample_phrases(self, text_list: List[str], max_phrases: int = None) -> List[str]:
         """
         テキストからサンプルフレーズを抽出（完全に中立的な抽出）
         
         Args:
-            text_list: テキストのリスト
+            text_list: ノイズ除去済みの字幕テキストのリスト
             max_phrases: 抽出する最大フレーズ数
             
         Returns:
@@ -274,49 +431,55 @@ class YouTubeCollector:
         try:
             if max_phrases is None:
                 max_phrases = SAMPLE_PHRASES_MAX
-                
-            all_text = ' '.join(text_list)
             
-            if not all_text:
+            if not text_list:
                 return []
             
-            # ノイズを除去（[音楽]、[拍手]などの記号）
-            cleaned_text = re.sub(r'\[.*?\]', '', all_text)
-            
-            # 文章を分割
-            sentences = re.split(r'[。！？\.\!\?]', cleaned_text)
-            
-            filtered_sentences = []
+            # フィルタリング・重複除去・ランダム選択を1回の走査で行い、保持する文は最大件数分に抑える
+            reservoir = []
+            seen = set()
+            unique_count = 0
             
-            for sentence in sentences:
-                sentence = sentence.strip()
+            # 文章を字幕ごとに分割しながら処理
+            for sentence in self._iter_sentences(text_list):
+                # 前後に空白がある場合のみstripする（ほとんどの文は空白を含まず、新しい文字列を作らずに済む）
+                if sentence and (sentence[0].isspace() or sentence[-1].isspace()):
+                    sentence = sentence.strip()
                 
                 # 基本的なフィルタリングのみ（特徴的パターンによる優先順位付けは廃止）
-                if (SAMPLE_PHRASE_MIN_LENGTH <= len(sentence) <= SAMPLE_PHRASE_MAX_LENGTH and 
-                    not re.match(r'^[音楽拍手効果音]+', sentence) and
-                    not re.match(rf'^[あ-ん]{{{REGEX_JAPANESE_CHAR_MIN},{REGEX_JAPANESE_CHAR_MAX}}}$', sentence) and
-                    sentence not in ['', ' ', 'うん', 'そう', 'はい', 'えー', 'あー']):
-                    
-                    filtered_sentences.append(sentence)
+                if not (SAMPLE_PHRASE_MIN_LENGTH <= len(sentence) <= SAMPLE_PHRASE_MAX_LENGTH and 
+                        sentence not in _FILLER_SENTENCES and
+                        not _JUNK_SENTENCE_RE.match(sentence)):
+                    continue
+                
+                # 正規化して重複チェック（正規化後の文字列は保持せず、長さとハッシュ値のみ記録）
+                normalized = sentence.lower()
+                if _WHITESPACE_RE.search(normalized):  # 空白を含む文のみ空白除去の変換を行う
+                    normalized = normalized.translate(_WHITESPACE_DELETE_TABLE)
+                if len(normalized) <= SAMPLE_PHRASE_MIN_LENGTH:
+                    continue
+                key = (len(normalized), hash(normalized))
+                if key in seen:
+                    continue
+                seen.add(key)
+                
+                # ランダムに選択（優先順位なし、リザーバサンプリング）
+                if unique_count < max_phrases:
+                    reservoir.append(sentence)
+                else:
+                    index = random.randrange(unique_count + 1)
+                    if index < max_phrases:
+                        reservoir[index] = sentence
+                unique_count += 1
             
-            # 重複を除去
-            unique_sentences = []
-            seen = set()
-            for sentence in filtered_sentences:
-                # 正規化して重複チェック
-                normalized = re.sub(r'\s+', '', sentence.lower())  # 空白除去＋小文字化
-                if normalized not in seen and len(normalized) > SAMPLE_PHRASE_MIN_LENGTH:
-                    unique_sentences.append(sentence)
-                    seen.add(normalized)
-            
-            # ランダムに選択（優先順位なし）
-            if len(unique_sentences) > max_phrases:
-                return random.sample(unique_sentences, max_phrases)
-            else:
-                return unique_sentences
+            # 件数を超えた場合は並び順もランダムにする（random.sampleと同じ振る舞い）
+            if unique_count > max_phrases:
+                random.shuffle(reservoir)
+            
+            return reservoir
             
         except Exception as e:
-            print(f"サンプルフレーズ抽出エラー: {e}")
+            self._log.warning("サンプルフレーズ抽出エラー: %s", e)
             return []
     
     def _check_sample_quality(self, sample_phrases: List[str]) -> List[str]:
@@ -334,26 +497,30 @@ class YouTubeCollector:
             
             # 品質基準
             for phrase in sample_phrases:
-                phrase = phrase.strip()
+                # 前後に空白がある場合のみstripする（ほとんどの文は空白を含まず、新しい文字列を作らずに済む）
+                if phrase and (phrase[0].isspace() or phrase[-1].isspace()):
+                    phrase = phrase.strip()
                 
-                # 基本的な品質チェック
-                if (len(phrase) < SAMPLE_QUALITY_MIN_LENGTH or len(phrase) > SAMPLE_QUALITY_MAX_LENGTH or
-                    phrase.count('詰んだろうが') > 0 or  # 明らかに間違った文を除外
-                    phrase.count('教会の常識') > 0 or
-                    re.match(r'^[同じ文章の繰り返し]', phrase) or
-                    phrase.count('。') > YOUTUBE_MAX_PERIOD_COUNT):  # 複数文が混在している場合
+                # 基本的な品質チェック（判定の軽いものから順に行い、早い段階で除外する）
+                phrase_length = len(phrase)
+                if phrase_length < SAMPLE_QUALITY_MIN_LENGTH or phrase_length > SAMPLE_QUALITY_MAX_LENGTH:
+                    continue
+                first_char = phrase[0]
+                if first_char in _REPEATED_TEXT_PREFIX_CHARS or first_char in _SOUND_EFFECT_PREFIX_CHARS:
+                    continue
+                if (phrase.count('。') > YOUTUBE_MAX_PERIOD_COUNT or  # 複数文が混在している場合
+                    any(bad in phrase for bad in _BAD_SUBSTRINGS)):
                     continue
                 
                 # 意味のある文かどうかチェック
-                if (not re.match(r'^[あいうえおかきくけこ]+$', phrase) and  # 意味のない文字列
-                    not re.match(r'^[音楽効果音]+', phrase) and
-                    phrase not in ['', ' ', 'はい', 'そう', 'うん']):
+                if (phrase not in _FILLER_SENTENCES and
+                    not all(c in _MEANINGLESS_CHARS for c in phrase)):  # 意味のない文字列
                     quality_phrases.append(phrase)
             
             return quality_phrases
             
         except Exception as e:
-            print(f"サンプル品質チェックエラー: {e}")
+            self._log.warning("サンプル品質チェックエラー: %s", e)
             return sample_phrases  # エラー時は元のリストを返す
     
     def filter_character_speech(self, text_list: List[str], character_name: str, api_key: str = None) -> List[str]:
@@ -373,17 +540,15 @@ class YouTubeCollector:
             return self._extract_sample_phrases(text_list)
         
         try:
-            import openai
-            client = openai.OpenAI(api_key=api_key)
+            client = self._get_openai_client(api_key)
             
-            all_text = ' '.join(text_list)
-            if len(all_text) > CHATGPT_FILTER_TEXT_LIMIT:  # テキストが長すぎる場合は切り詰め
-                all_text = all_text[:CHATGPT_FILTER_TEXT_LIMIT]
+            # テキストが長すぎる場合は切り詰め
+            all_text = _join_limited(text_list, CHATGPT_FILTER_TEXT_LIMIT)
             
-            print(f"  ChatGPT APIで{character_name}の発言を特定中...")
+            self._log.info("  ChatGPT APIで%sの発言を特定中...", character_name)
             
             # プロンプトを構築（キャラクター特有の特徴を含める）
-            system_prompt = "あなたは字幕から特定キャラクターの発言を抽出する専門家です。キャラクターの特徴的な口調や語尾を正確に識別し、他のキャラクターや関係ない発言は確実に除外してください。"
+            system_prompt = _FILTER_SYSTEM_PROMPT
             
             # キャラクター固有の特徴を追加
             character_features = self._get_character_features(character_name)
@@ -429,7 +594,7 @@ class YouTubeCollector:
             filtered_text = response.choices[0].message.content.strip()
             filtered_phrases = [phrase.strip() for phrase in filtered_text.split('\n') if phrase.strip()]
             
-            print(f"  ✅ {len(filtered_phrases)}個の{character_name}らしい発言を特定")
+            self._log.info("  ✅ %s個の%sらしい発言を特定", len(filtered_phrases), character_name)
             
             # APIのやり取りも返す
             return {
@@ -444,7 +609,7 @@ class YouTubeCollector:
             }
             
         except Exception as e:
-            print(f"  ❌ ChatGPT APIによるフィルタリング失敗: {e}")
+            self._log.error("  ❌ ChatGPT APIによるフィルタリング失敗: %s", e)
             # フォールバック: 基本的なフィルタリング
             return {
                 "filtered_phrases": self._extract_sample_phrases(text_list),
@@ -454,7 +619,47 @@ class YouTubeCollector:
                 }
             }
     
-    def _get_character_features(self, character_name: str) -> str:
+    def _get_openai_client(self, api_key: str):
+        """
+        API Keyに対応するOpenAIクライアントを取得（未生成の場合のみ生成）
+        
+        Args:
+            api_key: OpenAI API Key
+            
+        Returns:
+            OpenAIクライアント
+        """
+        client = self._openai_clients.get(api_key)
+        if client is None:
+            client = openai.OpenAI(api_key=api_key)
+            self._openai_clients[api_key] = client
+        return client
+    
+    def filter_character_speeches_batch(self, jobs: List[Tuple[List[str], str]], api_key: str = None,
+                                        concurrency: int = YOUTUBE_FILTER_CONCURRENCY) -> List[Any]:
+        """
+        複数の字幕・キャラクターの組に対して発言抽出を並列で実行
+        
+        Args:
+            jobs: (字幕テキストのリスト, 対象キャラクター名) のリスト
+            api_key: OpenAI API Key（オプション）
+            concurrency: 同時に実行するリクエスト数
+            
+        Returns:
+            jobsと同じ順序のfilter_character_speechの結果のリスト
+        """
+        if not jobs:
+            return []
+        
+        # 処理はAPIの応答待ちが中心のため、スレッドで並列化して往復時間を重ねる
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(jobs))) as executor:
+            return list(executor.map(
+                lambda job: self.filter_character_speech(job[0], job[1], api_key), jobs
+            ))
+    
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _get_character_features(character_name: str) -> str:
         """
         キャラクター固有の特徴を取得（中立的な分析指示のみ）
         
@@ -474,12 +679,12 @@ class YouTubeCollector:
 - 他のキャラクターと区別される言語的特徴
 """
     
-    def _analyze_speech_patterns(self, text: str, character_name: str, api_key: str) -> Dict[str, Any]:
+    def _analyze_speech_patterns(self, text_list: List[str], character_name: str, api_key: str) -> Dict[str, Any]:
         """
         YouTube字幕から検索パターン相当の言語特徴を分析
         
         Args:
-            text: 字幕テキスト
+            text_list: 字幕テキストのリスト
             character_name: キャラクター名
             api_key: OpenAI API Key
             
@@ -487,30 +692,13 @@ class YouTubeCollector:
             分析結果の辞書
         """
         try:
-            if not text or not api_key:
+            if not text_list or not api_key:
                 return {}
             
             # テキストが長すぎる場合は切り詰め
-            if len(text) > YOUTUBE_ANALYSIS_TEXT_LIMIT:
-                text = text[:YOUTUBE_ANALYSIS_TEXT_LIMIT]
+            text = _join_limited(text_list, YOUTUBE_ANALYSIS_TEXT_LIMIT)
             
-            import openai
-            client = openai.OpenAI(api_key=api_key)
-            
-            # 検索パターンを取得
-            search_patterns = get_search_patterns(character_name)
-            pattern_descriptions = [
-                "人物プロフィール・基本情報",
-                "名台詞・決まり文句",
-                "セリフ・発言例",
-                "口癖・語尾",
-                "話し方・特徴",
-                "キャラクター・性格",
-                "一人称・呼び方",
-                "決まり文句・常套句",
-                "特徴・特性",
-                "解説・まとめ"
-            ]
+            client = self._get_openai_client(api_key)
             
             system_prompt = """あなたは動画字幕から話者の言語的特徴を中立的に分析する専門家です。
 話者の特定に注意を払い、指定されたキャラクターの発言のみを分析してください。"""
@@ -572,26 +760,19 @@ class YouTubeCollector:
             
             # 結果を解析して構造化
             analysis_result = {}
-            lines = result_text.split('\n')
-            
-            for line in lines:
-                line = line.strip()
-                if ':' in line and line.startswith('項目'):
-                    try:
-                        # "項目1: 内容" の形式から抽出
-                        parts = line.split(':', 1)
-                        if len(parts) == 2:
-                            item_num = parts[0].replace('項目', '').strip()
-                            content = parts[1].strip()
-                            if content and content != 'なし':
-                                analysis_result[f"pattern_{item_num}"] = content
-                    except:
-                        continue
-            
-            print(f"  🎯 YouTube言語特徴分析: {len(analysis_result)}項目抽出")
+            for line in result_text.split('\n'):
+                # "項目1: 内容" の形式から抽出（全角コロンも許容）
+                match = _ANALYSIS_ITEM_RE.match(line.strip())
+                if not match:
+                    continue
+                content = match.group(2).strip()
+                if content and content != 'なし':
+                    analysis_result[f"pattern_{match.group(1)}"] = content
+            
+            self._log.info("  🎯 YouTube言語特徴分析: %s項目抽出", len(analysis_result))
             
             return analysis_result
             
         except Exception as e:
-            print(f"YouTube言語特徴分析エラー: {e}")
+            self._log.warning("YouTube言語特徴分析エラー: %s", e)
             return {}
\ No newline at end of file
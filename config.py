@@ -3,7 +3,8 @@
 """
 
 import os
-from typing import List
+from functools import lru_cache
+from typing import Tuple
 from dotenv import load_dotenv
 
 # .envファイルから環境変数を読み込み
@@ -42,6 +43,8 @@ YOUTUBE_MAX_VIDEOS = 15
 YOUTUBE_MAX_TRANSCRIPTS = 10
 YOUTUBE_TRANSCRIPT_LIMIT = 3000
 YOUTUBE_SEARCH_DELAY = 1.0
+YOUTUBE_TRANSCRIPT_FETCH_CONCURRENCY = 8  # 字幕を並列取得する際の同時実行数
+YOUTUBE_FILTER_CONCURRENCY = 4  # 発言抽出（ChatGPT API）を一括実行する際の同時リクエスト数
 
 # ==============================================================================
 # コレクター設定
@@ -50,6 +53,11 @@ YOUTUBE_SEARCH_DELAY = 1.0
 # Wikipedia設定
 WIKIPEDIA_SUMMARY_LIMIT = 1000
 WIKIPEDIA_FALLBACK_LIMIT = 500
+WIKIPEDIA_API_URL = "https://{language}.wikipedia.org/w/api.php"  # MediaWiki APIのエンドポイント
+WIKIPEDIA_MAX_CONCURRENCY = 10  # 複数名を一括収集する際の同時リクエスト数
+WIKIPEDIA_DISAMBIGUATION_CANDIDATES = 10  # 曖昧さ回避時にまとめて取得する候補ページ数（APIの上限は50）
+WIKIPEDIA_CANDIDATE_SCORE_CHARS = 300  # 候補のスコアリングに使う導入部の文字数
+WIKIPEDIA_EXTRACT_MAX_CHARS = 1200  # APIに返させる本文の最大文字数（excharsの上限は1200）
 
 # 共通設定
 DEFAULT_DELAY = 2.0
@@ -117,6 +125,16 @@ GOOGLE_PATTERN_TIMEOUT = 90
 GOOGLE_SEARCH_TIMEOUT = 60
 GOOGLE_MIN_TEXT_LENGTH_FOR_API = 50
 GOOGLE_YOUTUBE_API_RESULTS = 10
+GOOGLE_HTML_CONTENT_TYPES = ("text/html", "application/xhtml")  # 本文抽出の対象とするContent-Type
+GOOGLE_PAGE_MAX_BYTES = 512 * 1024  # ページ本文の最大ダウンロードバイト数（超過分は読み込まない。head内のスクリプト等を考慮した値）
+GOOGLE_API_MAX_CONCURRENCY = 4  # Custom Search APIへの同時リクエスト数の上限
+GOOGLE_PAGE_FETCH_CONCURRENCY = 10  # ページ内容の同時取得数の上限
+GOOGLE_API_QPS = 10.0  # Custom Search APIの1秒あたりのリクエスト上限
+GOOGLE_API_BUCKET_CAPACITY = 10  # Custom Search APIのバースト許容数
+GOOGLE_SCRAPE_BUCKET_CAPACITY = 3  # 検索結果ページ直接取得のバースト許容数
+GOOGLE_RATE_LIMIT_PENALTY_TOKENS = 3  # 429エラー時に差し引くトークン数
+GOOGLE_SCRAPE_WINDOW_SECONDS = 60  # 検索結果ページ直接取得のスライディングウィンドウ長（秒）
+GOOGLE_SCRAPE_WINDOW_LIMIT = 6  # ウィンドウ内で許可する検索結果ページ取得数
 
 # ==============================================================================
 # HTTPクライアント設定
@@ -131,6 +149,40 @@ HTTP_TIMEOUT_WAIT_MULTIPLIER = 3
 HTTP_CONNECTION_ERROR_WAIT_MULTIPLIER = 4
 HTTP_SKIP_RETRY_STATUS_CODES = [404, 403, 406, 410, 503]
 
+# コネクションプール・アダプターレベルのリトライ設定
+HTTP_POOL_CONNECTIONS = 32  # ホストごとに保持するプール数
+HTTP_POOL_MAXSIZE = 32  # プールあたりの最大コネクション数
+HTTP_ADAPTER_RETRY_TOTAL = 3
+HTTP_ADAPTER_BACKOFF_FACTOR = 0.5
+HTTP_ADAPTER_RETRY_STATUS_CODES = [429, 500, 502, 503, 504]
+HTTP_STREAM_CHUNK_SIZE = 16384  # ストリーミング読み込み時のチャンクサイズ（バイト）
+HTTP_SESSION_MAX_AGE = 300  # 保持しているkeep-alive接続を破棄して張り直すまでの秒数
+
+# ==============================================================================
+# キャッシュ設定
+# ==============================================================================
+
+# Google Custom Search APIのレスポンスキャッシュ
+GOOGLE_API_CACHE_TTL = 86400  # 有効期限（秒）
+GOOGLE_API_CACHE_MAX_SIZE = 1024
+# ページ内容の抽出結果キャッシュ
+PAGE_CONTENT_CACHE_TTL = 3600  # 有効期限（秒）
+PAGE_CONTENT_CACHE_MAX_SIZE = 2048
+# 本文ごとの口調パターン抽出結果キャッシュ
+SPEECH_PATTERN_CACHE_TTL = 86400  # 有効期限（秒）
+SPEECH_PATTERN_CACHE_MAX_SIZE = 1024
+# ディスクキャッシュの保存先
+CACHE_DIR = ".cache"
+# Wikipedia収集結果のディスクキャッシュ
+WIKIPEDIA_CACHE_TTL = 86400  # 有効期限（秒）
+WIKIPEDIA_NEGATIVE_CACHE_TTL = 3600  # ページが存在しなかった結果の有効期限（秒）
+WIKIPEDIA_MEMORY_CACHE_MAX_SIZE = 512  # プロセス内に保持する収集結果の最大件数
+# YouTube字幕のキャッシュ（字幕が取得できた動画のみ保存）
+YOUTUBE_TRANSCRIPT_CACHE_TTL = 604800  # 有効期限（秒）
+YOUTUBE_TRANSCRIPT_MEMORY_CACHE_MAX_SIZE = 1024
+# キャラクター単位のWeb検索・YouTube収集結果のディスクキャッシュ（情報が見つかった結果のみ保存）
+CHARACTER_INFO_CACHE_TTL = 86400  # 有効期限（秒）
+
 # ==============================================================================
 # YouTube処理設定
 # ==============================================================================
@@ -234,6 +286,9 @@ API_KEY_DISPLAY_END_LENGTH = 4
 # JSON書き込み設定
 JSON_INDENT_LEVEL = 2
 
+# 実行ログの書き出し間隔（秒）。記録のたびには保存せず、この間隔でまとめて保存する
+EXECUTION_LOG_FLUSH_INTERVAL = 1.0
+
 # テキストプレビュー長（文字数）
 PREVIEW_LENGTH_SHORT = 10
 PREVIEW_LENGTH_TITLE = 30
@@ -272,14 +327,18 @@ TITLE_MIN_LENGTH = 10
 # 特殊なトークン設定
 BING_FILTER_MAX_TOKENS = 500
 
+# コンソールログ出力設定
+CONSOLE_LOG_FORMAT = "%(message)s"
+CONSOLE_LOG_APP_LOGGERS = ("collectors", "core", "generators", "utils")  # 指定レベルで出力するアプリ側のロガー（それ以外はWARNING以上のみ）
+
 # ==============================================================================
 # 検索パターン関数
 # ==============================================================================
 
-def get_search_patterns(name: str) -> List[str]:
-    """キャラクター名を適用した検索パターンを取得"""
-    patterns = [
-        '"{name}" 口癖 語尾',
-        '"{name}" 話し方 特徴'
-    ]  # 3パターンから2パターンに減らして高速化
-    return [pattern.format(name=name) for pattern in patterns]
\ No newline at end of file
+@lru_cache(maxsize=1024)
+def get_search_patterns(name: str) -> Tuple[str, ...]:
+    """キャラクター名を適用した検索パターンを取得（同じ名前の場合はキャッシュを返すため変更不可のタプル）"""
+    return (
+        f'"{name}" 口癖 語尾',
+        f'"{name}" 話し方 特徴'
+    )  # 3パターンから2パターンに減らして高速化
\ No newline at end of file
@@ -2,27 +2,124 @@
 キャラクター情報収集を統括するサービスクラス
 """
 
+import os
+import threading
 import time
-from typing import Dict, Any, Optional
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Dict, Any, Optional, Callable, Tuple, List
 
 from core.interfaces import BaseCollector
 from core.collector_factory import CollectorFactory, SearchEngineType
 from core.exceptions import CollectorError
+from utils.cache import DiskCache
 from utils.execution_logger import ExecutionLogger
 from config import (
     YOUTUBE_MAX_VIDEOS, GOOGLE_API_KEY, GOOGLE_CX,
     CONCURRENT_WORKERS, COLLECTION_TIMEOUT_TOTAL,
     COLLECTION_TIMEOUT_WIKIPEDIA, COLLECTION_TIMEOUT_WEB_SEARCH,
-    COLLECTION_TIMEOUT_YOUTUBE
+    COLLECTION_TIMEOUT_YOUTUBE, CACHE_DIR, CHARACTER_INFO_CACHE_TTL
 )
 
 
+# キャラクター名と収集条件ごとのWeb検索・YouTube収集結果（Wikipediaはコレクター側でキャッシュ済み）
+_RESULT_CACHE = DiskCache(os.path.join(CACHE_DIR, "character_info.sqlite3"))
+
+
+def _normalize_cache_name(name: str) -> str:
+    """
+    キャッシュキー用にキャラクター名を正規化
+    
+    全角・半角の違い、空白の有無、英字の大文字・小文字の違いを同一視する
+    （例:「初音 ミク」「初音ミク」「初音ﾐｸ」は同じキーになる）。
+    
+    Args:
+        name: キャラクター名
+        
+    Returns:
+        正規化した名前
+    """
+    return ''.join(unicodedata.normalize('NFKC', name).casefold().split())
+
+
+# 実行中の収集タスクに対応する取り消しイベント（タスクを実行するスレッドごとに保持）
+_task_state = threading.local()
+
+
+def _current_cancel_event() -> Optional[threading.Event]:
+    """
+    現在のスレッドで実行中の収集タスクの取り消しイベントを取得
+    
+    Returns:
+        取り消しイベント（収集タスク外の場合はNone）
+    """
+    return getattr(_task_state, "cancel_event", None)
+
+
+def _run_with_cancel_event(task: Callable[[], Dict[str, Any]], cancel_event: threading.Event) -> Dict[str, Any]:
+    """
+    取り消しイベントを現在のスレッドに設定して収集タスクを実行
+    
+    Args:
+        task: 収集タスク
+        cancel_event: タイムアウト時にセットされる取り消しイベント
+        
+    Returns:
+        収集タスクの結果
+    """
+    _task_state.cancel_event = cancel_event
+    try:
+        return task()
+    finally:
+        _task_state.cancel_event = None
+
+
+def _print(*args, **kwargs):
+    """タイムアウト済みの収集タスクからはコンソールに出力しないprint"""
+    cancel_event = _current_cancel_event()
+    if cancel_event is None or not cancel_event.is_set():
+        print(*args, **kwargs)
+
+
+class _TaskLogger:
+    """タイムアウト後の記録を捨てるExecutionLoggerのラッパー"""
+    
+    def __init__(self, logger: ExecutionLogger, cancel_event: threading.Event):
+        self._logger = logger
+        self._cancel_event = cancel_event
+    
+    def __getattr__(self, attr: str):
+        value = getattr(self._logger, attr)
+        if not callable(value):
+            return value
+        
+        def call(*args, **kwargs):
+            # タイムアウト結果で置き換え済みのタスクは最終結果の記録後に書き込まない
+            if not self._cancel_event.is_set():
+                return value(*args, **kwargs)
+        
+        return call
+
+
 class CharacterInfoService:
     """キャラクター情報収集を統括するサービス"""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, use_cache: bool = True):
         self.api_key = api_key
-        self.logger: Optional[ExecutionLogger] = None
+        self.use_cache = use_cache
+        self.logger = None
+    
+    @property
+    def logger(self) -> Optional[ExecutionLogger]:
+        """実行ログ（収集タスク内ではタイムアウト後に記録を止めるラッパーを返す）"""
+        cancel_event = _current_cancel_event()
+        if self._logger is None or cancel_event is None:
+            return self._logger
+        return _TaskLogger(self._logger, cancel_event)
+    
+    @logger.setter
+    def logger(self, logger: Optional[ExecutionLogger]):
+        self._logger = logger
     
     def collect_character_info(
         self,
@@ -32,7 +129,9 @@ class CharacterInfoService:
         use_google: bool = True,
         use_duckduckgo: bool = False,
         use_bing: bool = False,
-        use_chatgpt_search: bool = False
+        use_chatgpt_search: bool = False,
+        combine_search_engines: bool = False,
+        force_refresh: bool = False
     ) -> Dict[str, Any]:
         """
         キャラクター情報を包括的に収集
@@ -45,46 +144,60 @@ class CharacterInfoService:
             use_duckduckgo: DuckDuckGo検索を使用するか
             use_bing: Bing検索を使用するか
             use_chatgpt_search: ChatGPT検索を使用するか
+            combine_search_engines: 有効な検索エンジンをすべて並列実行して結果を統合するか
+                                    （Falseの場合は優先度の最も高い1エンジンのみ）
+            force_refresh: キャッシュを読まずに収集し直すか（結果はキャッシュに保存する）
             
         Returns:
             収集したキャラクター情報
+            
+        Note:
+            タイムアウトしたタスクには取り消しイベントを通知し、コレクターはリクエスト・動画・
+            検索パターンの区切りで処理を打ち切る。実行中のHTTPリクエスト（REQUEST_TIMEOUTで上限あり）
+            は中断できないため、その完了まではスレッドが残り、プロセス終了もそれを待つ。
+            打ち切りまでの間、タスクはコンソール出力と実行ログへの記録を行わない。
         """
         self.logger = logger
         character_info = {"name": name}
-        
-        print("📚 情報収集中... (順次実行)")
-        
-        # 順次実行でWikipedia、Web検索、YouTube情報収集を実行
-        print("\n  📋 タスクを順次実行:")
-        
-        # 1. Wikipedia情報収集
-        print("\n  1️⃣ Wikipedia情報収集を開始...")
-        character_info["wikipedia_info"] = self._collect_wikipedia_info(name)
-        print("✅ Wikipedia情報収集完了")
-        # 即座にログを保存
-        if self.logger:
-            self.logger._save_log()
-        
-        # 2. Web検索情報収集  
-        print("\n  2️⃣ Web検索情報収集を開始...")
-        character_info["google_search_results"] = self._collect_web_search_info(
-            name, use_google, use_duckduckgo, use_bing, use_chatgpt_search
+        read_cache = self.use_cache and not force_refresh
+        # 検索エンジンの選択とOpenAI API Keyの有無で結果が変わるため、キーに含める
+        search_flags = (
+            use_google, use_duckduckgo, use_bing, use_chatgpt_search,
+            combine_search_engines, bool(self.api_key)
         )
-        print("✅ Web検索情報収集完了")
-        # 即座にログを保存
-        if self.logger:
-            self.logger._save_log()
         
-        # 3. YouTube情報収集
+        print(f"📚 情報収集中... (並列実行: 最大{CONCURRENT_WORKERS}タスク)")
+        
+        # Wikipedia、Web検索、YouTube情報収集は互いに独立したネットワーク待ちが中心のため並列で実行
+        tasks = {
+            "wikipedia_info": (
+                lambda: self._collect_wikipedia_info(name),
+                COLLECTION_TIMEOUT_WIKIPEDIA,
+                "Wikipedia情報収集"
+            ),
+            "google_search_results": (
+                lambda: self._cached(
+                    "web_search", name, search_flags, read_cache,
+                    lambda: self._collect_web_search_info(
+                        name, use_google, use_duckduckgo, use_bing, use_chatgpt_search,
+                        combine_search_engines
+                    )
+                ),
+                COLLECTION_TIMEOUT_WEB_SEARCH,
+                "Web検索情報収集"
+            ),
+        }
         if use_youtube:
-            print("\n  3️⃣ YouTube情報収集を開始...")
-            character_info["youtube_transcripts"] = self._collect_youtube_info(
-                name, use_chatgpt_search, use_bing, use_duckduckgo, use_google
+            tasks["youtube_transcripts"] = (
+                lambda: self._cached(
+                    "youtube", name, search_flags, read_cache,
+                    lambda: self._collect_youtube_info(
+                        name, use_chatgpt_search, use_bing, use_duckduckgo, use_google
+                    )
+                ),
+                COLLECTION_TIMEOUT_YOUTUBE,
+                "YouTube情報収集"
             )
-            print("✅ YouTube情報収集完了")
-            # 即座にログを保存
-            if self.logger:
-                self.logger._save_log()
         else:
             character_info["youtube_transcripts"] = {
                 "found": False,
@@ -95,26 +208,140 @@ class CharacterInfoService:
                 "skipped": True
             }
         
+        start_time = time.monotonic()
+        executor = ThreadPoolExecutor(max_workers=CONCURRENT_WORKERS)
+        cancel_events = {key: threading.Event() for key in tasks}
+        try:
+            futures = {
+                key: executor.submit(_run_with_cancel_event, task, cancel_events[key])
+                for key, (task, _, _) in tasks.items()
+            }
+            
+            for key, future in futures.items():
+                _, task_timeout, label = tasks[key]
+                # タスクごとのタイムアウトと全体のタイムアウトのうち、先に来る方まで待つ
+                elapsed = time.monotonic() - start_time
+                remaining = max(0.0, min(task_timeout, COLLECTION_TIMEOUT_TOTAL) - elapsed)
+                try:
+                    character_info[key] = future.result(timeout=remaining)
+                    print(f"✅ {label}完了")
+                except FutureTimeoutError:
+                    # 未着手なら取り消し、実行中ならコレクターに打ち切りを通知する
+                    future.cancel()
+                    cancel_events[key].set()
+                    error_msg = f"{label}がタイムアウトしました（{task_timeout}秒）"
+                    print(f"⚠️ {error_msg}")
+                    if self.logger:
+                        self.logger.log_error("collection_timeout", error_msg, {"character_name": name, "task": key})
+                    character_info[key] = self._create_timeout_result(key, error_msg)
+        finally:
+            # タイムアウトしたタスクの終了は待たずに戻る（スレッドは次の区切りで打ち切られる）
+            executor.shutdown(wait=False, cancel_futures=True)
+        
         return character_info
     
+    def invalidate(self):
+        """Web検索・YouTube収集結果のキャッシュを削除"""
+        _RESULT_CACHE.clear()
+    
+    def _cached(
+        self,
+        kind: str,
+        name: str,
+        flags: Tuple[bool, ...],
+        read_cache: bool,
+        collect: Callable[[], Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        収集結果をキャッシュから取得し、なければ収集して保存
+        
+        Args:
+            kind: 収集の種類（キャッシュキーの接頭辞）
+            name: キャラクター名
+            flags: 結果に影響する収集条件
+            read_cache: キャッシュを読むか
+            collect: 収集処理
+            
+        Returns:
+            収集結果の辞書
+        """
+        key = f"{kind}:{_normalize_cache_name(name)}:{':'.join('1' if flag else '0' for flag in flags)}"
+        
+        if read_cache:
+            try:
+                cached = _RESULT_CACHE.get(key)
+            except Exception as e:
+                _print(f"    収集結果キャッシュ読み込みエラー: {e}")
+                cached = None
+            if cached is not None:
+                _print(f"    💾 キャッシュ済みの収集結果を使用 ({kind})")
+                return cached
+        
+        result = collect()
+        
+        # 見つからなかった結果は一時的なエラーの可能性があるため保存しない
+        if result.get("found"):
+            try:
+                _RESULT_CACHE.set(key, result, CHARACTER_INFO_CACHE_TTL)
+            except Exception as e:
+                _print(f"    収集結果キャッシュ保存エラー: {e}")
+        
+        return result
+    
+    @staticmethod
+    def _create_timeout_result(key: str, error_msg: str) -> Dict[str, Any]:
+        """
+        タイムアウトしたタスクの結果を作成
+        
+        Args:
+            key: character_infoのキー
+            error_msg: エラーメッセージ
+            
+        Returns:
+            各収集処理のエラー時と同じ形式の辞書
+        """
+        if key == "wikipedia_info":
+            return {
+                "found": False,
+                "error": error_msg,
+                "title": None,
+                "summary": None,
+                "content": None,
+                "url": None,
+                "categories": []
+            }
+        if key == "youtube_transcripts":
+            return {
+                "found": False,
+                "error": error_msg,
+                "transcripts": [],
+                "total_videos": 0,
+                "sample_phrases": []
+            }
+        return {
+            "found": False,
+            "error": error_msg,
+            "results": [],
+            "total_results": 0
+        }
+    
     def _collect_wikipedia_info(self, name: str) -> Dict[str, Any]:
         """Wikipedia情報を収集"""
         try:
-            print("📖 Wikipedia情報を収集中...")
+            _print("📖 Wikipedia情報を収集中...")
             if self.logger:
                 self.logger.log_step("wikipedia_collection", "start", {"character_name": name})
-                self.logger._save_log()  # 開始時にログを即座に保存
             
             start_time = time.time()
-            print(f"    キャラクター名「{name}」でWikipediaを検索中...")
-            collector = CollectorFactory.create_wikipedia_collector()
+            _print(f"    キャラクター名「{name}」でWikipediaを検索中...")
+            collector = CollectorFactory.create_wikipedia_collector(use_cache=self.use_cache)
             result = collector.collect_info(name, logger=self.logger)
             duration = time.time() - start_time
             
             if result and hasattr(result, 'found') and result.found:
-                print(f"    ✅ Wikipedia記事を発見")
+                _print(f"    ✅ Wikipedia記事を発見")
             else:
-                print(f"    ⚠️ Wikipedia記事が見つかりませんでした")
+                _print(f"    ⚠️ Wikipedia記事が見つかりませんでした")
             
             if self.logger:
                 self.logger.log_step("wikipedia_collection", "success", result.to_dict(), duration)
@@ -155,18 +382,94 @@ class CharacterInfoService:
         use_google: bool, 
         use_duckduckgo: bool, 
         use_bing: bool, 
-        use_chatgpt_search: bool
+        use_chatgpt_search: bool,
+        combine_search_engines: bool = False
     ) -> Dict[str, Any]:
-        """Web検索情報を収集"""
-        try:
-            # 検索エンジンを決定
-            engine_type = CollectorFactory.determine_best_search_engine(
-                use_chatgpt=use_chatgpt_search,
-                use_bing=use_bing,
-                use_duckduckgo=use_duckduckgo,
-                use_google=use_google
-            )
+        """Web検索情報を収集（combine_search_engines指定時は有効な全エンジンを並列実行して結果を統合）"""
+        engine_types = CollectorFactory.determine_enabled_search_engines(
+            use_chatgpt=use_chatgpt_search,
+            use_bing=use_bing,
+            use_duckduckgo=use_duckduckgo,
+            use_google=use_google,
+            combine=combine_search_engines
+        )
+        if len(engine_types) == 1:
+            return self._collect_engine_search_info(name, engine_types[0])
+        
+        # エンジンごとの待ち時間を重ねるため、全エンジンを同時に問い合わせる
+        start_time = time.time()
+        cancel_event = _current_cancel_event() or threading.Event()
+        with ThreadPoolExecutor(max_workers=len(engine_types)) as executor:
+            futures = [
+                executor.submit(
+                    _run_with_cancel_event,
+                    lambda engine_type=engine_type: self._collect_engine_search_info(name, engine_type),
+                    cancel_event
+                )
+                for engine_type in engine_types
+            ]
+            engine_results = [future.result() for future in futures]
+        
+        return self._merge_web_search_results(
+            name, engine_types, engine_results, time.time() - start_time
+        )
+    
+    @staticmethod
+    def _merge_web_search_results(
+        name: str,
+        engine_types: List[SearchEngineType],
+        engine_results: List[Dict[str, Any]],
+        duration: float
+    ) -> Dict[str, Any]:
+        """
+        複数エンジンの検索結果をURLで重複排除して統合
+        
+        Args:
+            name: キャラクター名
+            engine_types: 実行した検索エンジン（優先度順）
+            engine_results: engine_types と同順の各エンジンの結果辞書
+            duration: 全体の処理時間（秒）
             
+        Returns:
+            単一エンジンの場合と同じ形式の結果辞書
+        """
+        merged: List[Dict[str, Any]] = []
+        seen_urls = set()
+        errors = []
+        for engine_type, engine_result in zip(engine_types, engine_results):
+            if engine_result.get("error"):
+                errors.append(f"{engine_type.value}: {engine_result['error']}")
+            for item in engine_result.get("results", []):
+                url = item.get("url") if isinstance(item, dict) else None
+                if url:
+                    if url in seen_urls:
+                        continue
+                    seen_urls.add(url)
+                merged.append(item)
+        
+        found = any(engine_result.get("found") for engine_result in engine_results)
+        return {
+            "found": found,
+            "error": None if found else ("; ".join(errors) or None),
+            "results": merged,
+            "total_results": len(merged),
+            "query": name,
+            "source": ",".join(engine_type.value for engine_type in engine_types),
+            "duration": duration
+        }
+    
+    def _collect_engine_search_info(self, name: str, engine_type: SearchEngineType) -> Dict[str, Any]:
+        """
+        指定した検索エンジンでWeb検索情報を収集
+        
+        Args:
+            name: キャラクター名
+            engine_type: 使用する検索エンジン
+            
+        Returns:
+            検索結果の辞書
+        """
+        try:
             # 適切なメッセージを表示
             engine_messages = {
                 SearchEngineType.CHATGPT: "🤖 ChatGPT知識ベース検索中...",
@@ -175,8 +478,8 @@ class CharacterInfoService:
                 SearchEngineType.GOOGLE: "🔍 Google検索情報を収集中..."
             }
             
-            print(engine_messages.get(engine_type, "🔍 Web検索情報を収集中..."))
-            print(f"    キャラクター名「{name}」で検索開始...")
+            _print(engine_messages.get(engine_type, "🔍 Web検索情報を収集中..."))
+            _print(f"    キャラクター名「{name}」で検索開始...")
             
             if self.logger:
                 step_name = f"{engine_type.value}_collection"
@@ -186,14 +489,16 @@ class CharacterInfoService:
             collector = CollectorFactory.create_search_engine_collector(
                 engine_type, api_key=self.api_key
             )
-            result = collector.collect_info(name, logger=self.logger, api_key=self.api_key)
+            result = collector.collect_info(
+                name, logger=self.logger, api_key=self.api_key, cancel_event=_current_cancel_event()
+            )
             duration = time.time() - start_time
             
             if result and hasattr(result, 'found') and result.found:
                 result_count = getattr(result, 'total_results', 0)
-                print(f"    ✅ {result_count}件の検索結果を取得")
+                _print(f"    ✅ {result_count}件の検索結果を取得")
             else:
-                print(f"    ⚠️ 検索結果が見つかりませんでした")
+                _print(f"    ⚠️ 検索結果が見つかりませんでした")
             
             if self.logger:
                 step_name = f"{engine_type.value}_collection"
@@ -236,40 +541,41 @@ class CharacterInfoService:
     ) -> Dict[str, Any]:
         """YouTube情報を収集"""
         try:
-            print("🎥 YouTube情報を収集中...")
+            _print("🎥 YouTube情報を収集中...")
             if self.logger:
                 self.logger.log_step("youtube_collection", "start", {"character_name": name})
             
             start_time = time.time()
             
             # YouTube URL検索用のコレクターを選択
-            print(f"    YouTube動画URL検索中...")
+            _print(f"    YouTube動画URL検索中...")
             youtube_urls = self._get_youtube_urls(
                 name, use_chatgpt_search, use_bing, use_duckduckgo, use_google
             )
             
             if youtube_urls:
-                print(f"    {len(youtube_urls)}個のYouTube動画URLを発見")
+                _print(f"    {len(youtube_urls)}個のYouTube動画URLを発見")
             else:
-                print(f"    ⚠️ YouTube動画URLが見つかりませんでした")
+                _print(f"    ⚠️ YouTube動画URLが見つかりませんでした")
             
             # YouTube字幕収集
             if youtube_urls:
-                print(f"    字幕データ収集中（最大{YOUTUBE_MAX_VIDEOS}動画）...")
-            youtube_collector = CollectorFactory.create_youtube_collector()
+                _print(f"    字幕データ収集中（最大{YOUTUBE_MAX_VIDEOS}動画）...")
+            youtube_collector = CollectorFactory.create_youtube_collector(use_cache=self.use_cache)
             youtube_info = youtube_collector.collect_info(
                 youtube_urls,
                 max_videos=YOUTUBE_MAX_VIDEOS,
                 logger=self.logger, 
                 character_info={"name": name}, 
-                api_key=self.api_key
+                api_key=self.api_key,
+                cancel_event=_current_cancel_event()
             )
             
             if youtube_info.get('found', False):
                 transcript_count = len(youtube_info.get('transcripts', []))
-                print(f"    ✅ {transcript_count}個の動画から字幕を取得")
+                _print(f"    ✅ {transcript_count}個の動画から字幕を取得")
             else:
-                print(f"    ⚠️ 字幕データの取得に失敗しました")
+                _print(f"    ⚠️ 字幕データの取得に失敗しました")
             
             duration = time.time() - start_time
             
@@ -284,9 +590,9 @@ class CharacterInfoService:
             error_msg = f"YouTube情報収集エラー: {str(e)}"
             error_traceback = traceback.format_exc()
             
-            print(f"❌ YouTube情報収集エラーの詳細:")
-            print(f"エラー: {error_msg}")
-            print(f"トレースバック:\n{error_traceback}")
+            _print(f"❌ YouTube情報収集エラーの詳細:")
+            _print(f"エラー: {error_msg}")
+            _print(f"トレースバック:\n{error_traceback}")
             
             if self.logger:
                 self.logger.log_error("youtube_collection_error", error_msg, {
@@ -315,14 +621,14 @@ class CharacterInfoService:
         try:
             if use_chatgpt_search:
                 # ChatGPT検索の場合は代替手段でYouTube URLを取得
-                print("  YouTube動画URL取得: Web検索を使用（YouTube字幕収集のため）")
+                _print("  YouTube動画URL取得: Web検索を使用（YouTube字幕収集のため）")
                 
                 # 利用可能な検索エンジンを自動選択
                 if GOOGLE_API_KEY and GOOGLE_CX:
-                    print("    Google Custom Search APIでYouTube動画を検索")
+                    _print("    Google Custom Search APIでYouTube動画を検索")
                     collector = CollectorFactory.create_search_engine_collector(SearchEngineType.GOOGLE)
                 else:
-                    print("    Bing検索でYouTube動画を検索（Google API未設定のため）")
+                    _print("    Bing検索でYouTube動画を検索（Google API未設定のため）")
                     collector = CollectorFactory.create_search_engine_collector(SearchEngineType.BING)
                 
                 return collector.search_youtube_videos(name)
@@ -332,7 +638,7 @@ class CharacterInfoService:
                 return collector.search_youtube_videos(name)
             
             elif use_duckduckgo:
-                print("  注意: DuckDuckGo使用時はYouTube動画URLの自動検索はスキップされます")
+                _print("  注意: DuckDuckGo使用時はYouTube動画URLの自動検索はスキップされます")
                 return []
             
             elif use_google:
@@ -340,9 +646,9 @@ class CharacterInfoService:
                 return collector.search_youtube_videos(name)
             
             else:
-                print("  注意: Web検索が無効のためYouTube動画URLの自動検索はスキップされます")
+                _print("  注意: Web検索が無効のためYouTube動画URLの自動検索はスキップされます")
                 return []
                 
         except Exception as e:
-            print(f"YouTube URL取得エラー: {e}")
+            _print(f"YouTube URL取得エラー: {e}")
             return []
\ No newline at end of file
@@ -2,7 +2,7 @@
 コレクターのファクトリークラス
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
 from enum import Enum
 
 from core.interfaces import BaseCollector
@@ -44,6 +44,7 @@ class CollectorFactory:
                 delay=GOOGLE_DELAY,
                 google_api_key=GOOGLE_API_KEY,
                 google_cx=GOOGLE_CX,
+                openai_api_key=api_key,
                 **kwargs
             )
         
@@ -77,7 +78,7 @@ class CollectorFactory:
     def create_wikipedia_collector(**kwargs) -> BaseCollector:
         """Wikipediaコレクターを作成"""
         from collectors.wikipedia_collector import WikipediaCollector
-        return WikipediaCollector(**kwargs)
+        return WikipediaCollector.get(**kwargs)
     
     @staticmethod
     def create_youtube_collector(**kwargs) -> BaseCollector:
@@ -114,4 +115,47 @@ class CollectorFactory:
             return SearchEngineType.GOOGLE
         else:
             # デフォルトでChatGPTを選択（最も安定）
-            return SearchEngineType.CHATGPT
\ No newline at end of file
+            return SearchEngineType.CHATGPT
+    
+    @staticmethod
+    def determine_enabled_search_engines(
+        use_chatgpt: bool = False,
+        use_bing: bool = False,
+        use_duckduckgo: bool = False,
+        use_google: bool = True,
+        combine: bool = False
+    ) -> List[SearchEngineType]:
+        """
+        使用する検索エンジンを優先度順に列挙
+        
+        use_google は既定で有効なため、combine=False の場合は他のエンジンが指定されていれば
+        Googleを使わない（determine_best_search_engine と同じ1エンジンのみ）。
+        
+        Args:
+            use_chatgpt: ChatGPT検索を使用するか
+            use_bing: Bing検索を使用するか
+            use_duckduckgo: DuckDuckGo検索を使用するか
+            use_google: Google検索を使用するか
+            combine: 有効なエンジンをすべて併用するか
+            
+        Returns:
+            検索エンジンタイプのリスト（優先度順、1件以上）
+        """
+        best_engine = CollectorFactory.determine_best_search_engine(
+            use_chatgpt=use_chatgpt,
+            use_bing=use_bing,
+            use_duckduckgo=use_duckduckgo,
+            use_google=use_google
+        )
+        if not combine:
+            return [best_engine]
+        
+        engines = [
+            engine_type for engine_type, enabled in (
+                (SearchEngineType.CHATGPT, use_chatgpt),
+                (SearchEngineType.BING, use_bing),
+                (SearchEngineType.DUCKDUCKGO, use_duckduckgo),
+                (SearchEngineType.GOOGLE, use_google),
+            ) if enabled
+        ]
+        return engines or [best_engine]
@@ -44,6 +44,16 @@ class WikipediaError(CollectorError):
     pass
 
 
+class WikipediaPageNotFoundError(WikipediaError):
+    """Wikipediaページが存在しない場合の例外"""
+    pass
+
+
+class WikipediaDisambiguationError(WikipediaError):
+    """曖昧さ回避ページに該当した場合の例外（details["options"]に候補を保持）"""
+    pass
+
+
 class OpenAIError(APIError):
     """OpenAI API関連の例外"""
     pass
@@ -2,11 +2,25 @@
 共通インターフェースの定義
 """
 
+import re
 from abc import ABC, abstractmethod
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, field
 
 from utils.execution_logger import ExecutionLogger
+from utils.http_client import extract_domain
+
+
+# 基本的な話し方パターン抽出で検出するキーワードと対応するラベル
+_BASIC_PATTERN_LABELS = {
+    "口調": "表現: 口調・語尾に関する情報",
+    "語尾": "表現: 口調・語尾に関する情報",
+    "一人称": "表現: 話し方に関する情報",
+    "話し方": "表現: 話し方に関する情報",
+}
+_BASIC_PATTERN_RE = re.compile("|".join(map(re.escape, _BASIC_PATTERN_LABELS)))
+# ラベルの出力順（重複を除いた登録順）
+_BASIC_PATTERN_LABEL_ORDER = tuple(dict.fromkeys(_BASIC_PATTERN_LABELS.values()))
 
 
 @dataclass
@@ -152,12 +166,8 @@ class SearchEngineCollector(BaseCollector):
         pass
     
     def _extract_domain(self, url: str) -> str:
-        """URLからドメインを抽出するヘルパーメソッド"""
-        try:
-            from urllib.parse import urlparse
-            return urlparse(url).netloc
-        except Exception:
-            return "unknown"
+        """URLからドメインを抽出するヘルパーメソッド（結果はURLごとにキャッシュ）"""
+        return extract_domain(url)
     
     def _extract_basic_patterns(self, text: str, character_name: str) -> List[str]:
         """基本的な話し方パターンを抽出するヘルパーメソッド"""
@@ -173,12 +183,9 @@ class SearchEngineCollector(BaseCollector):
             if character_name and character_name.lower() in text_lower:
                 patterns.append(f"呼び方: {character_name}")
             
-            # 簡単な特徴抽出
-            if "口調" in text or "語尾" in text:
-                patterns.append("表現: 口調・語尾に関する情報")
-            
-            if "一人称" in text or "話し方" in text:
-                patterns.append("表現: 話し方に関する情報")
+            # 簡単な特徴抽出（全キーワードを1回の走査で検出）
+            found_labels = {_BASIC_PATTERN_LABELS[match.group(0)] for match in _BASIC_PATTERN_RE.finditer(text)}
+            patterns.extend(label for label in _BASIC_PATTERN_LABEL_ORDER if label in found_labels)
                 
         except Exception as e:
             print(f"パターン抽出エラー: {e}")
@@ -5,6 +5,7 @@
 
 import argparse
 import json
+import logging
 import os
 import sys
 import time
@@ -12,6 +13,7 @@ from pathlib import Path
 from typing import Dict, Any, Union, Optional
 from dotenv import load_dotenv
 from utils.execution_logger import ExecutionLogger
+from utils.log_config import setup_console_logging
 from config import (DISPLAY_SEPARATOR_LENGTH, DISPLAY_EMOJI_REPEAT_COUNT, 
                     ERROR_WAIT_TIME_HOURS_MIN, ERROR_WAIT_TIME_HOURS_MAX,
                     DISPLAY_SEPARATOR_CHAR, DISPLAY_EMOJI_SHIELD, DISPLAY_EMOJI_MASK)
@@ -62,15 +64,44 @@ def main():
         action="store_true",
         help="Web検索の代わりにChatGPTの知識ベースから情報を取得"
     )
+    parser.add_argument(
+        "--multi-search",
+        action="store_true",
+        help="指定した検索エンジンとGoogle検索を並列実行して結果を統合する（--no-google でGoogleを除外）"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="キャッシュ済みのWikipedia情報・Web検索結果・YouTube字幕を使わずに再取得する"
+    )
+    parser.add_argument(
+        "--verbose", "-v",
+        action="store_true",
+        help="収集処理の詳細なデバッグログを表示する"
+    )
     
     args = parser.parse_args()
     
+    # 検索処理の進捗ログをキュー経由でコンソールに出力
+    setup_console_logging(logging.DEBUG if args.verbose else logging.INFO)
+    
     # 検索エンジンフラグの競合チェック
     search_flags = [args.use_duckduckgo, args.use_bing, args.use_chatgpt_search]
-    if sum(search_flags) > 1:
+    if sum(search_flags) > 1 and not args.multi_search:
         print("エラー: 検索エンジンオプション（--use-duckduckgo, --use-bing, --use-chatgpt-search）は同時に指定できません。")
+        print("複数の検索エンジンを併用する場合は --multi-search を指定してください。")
         sys.exit(1)
     
+    # --multi-search 指定時に並列実行する検索エンジン（優先度順）
+    multi_search_engines = [
+        engine_label for enabled, engine_label in (
+            (args.use_chatgpt_search, "ChatGPT知識ベース"),
+            (args.use_bing, "Bing"),
+            (args.use_duckduckgo, "DuckDuckGo"),
+            (not args.no_google, "Google"),
+        ) if enabled
+    ] if args.multi_search else []
+    
     # 実行ログ開始
     logger = ExecutionLogger()
     logger.set_character_name(args.name)
@@ -90,7 +121,9 @@ def main():
     print(f"=== キャラクター口調プロンプト生成: {args.name} ===")
     
     # 検索エンジン選択の表示
-    if args.use_chatgpt_search:
+    if len(multi_search_engines) > 1:
+        print(f"🔀 検索エンジン: {' + '.join(multi_search_engines)}（並列実行・結果を統合）")
+    elif args.use_chatgpt_search:
         print("🤖 検索エンジン: ChatGPT知識ベース（完全AI検索）")
         print("    ✨ Web検索不要でレート制限なし、2023年4月までの知識を使用")
     elif args.use_bing:
@@ -128,7 +161,7 @@ def main():
         start_time = time.time()
         
         from core.character_info_service import CharacterInfoService
-        info_service = CharacterInfoService(api_key=api_key)
+        info_service = CharacterInfoService(api_key=api_key, use_cache=not args.no_cache)
         character_info = info_service.collect_character_info(
             args.name, 
             logger=logger, 
@@ -136,7 +169,8 @@ def main():
             use_google=not args.no_google, 
             use_duckduckgo=args.use_duckduckgo, 
             use_bing=args.use_bing, 
-            use_chatgpt_search=args.use_chatgpt_search
+            use_chatgpt_search=args.use_chatgpt_search,
+            combine_search_engines=args.multi_search
         )
         
         collection_duration = time.time() - start_time
@@ -219,6 +253,10 @@ def main():
             command_parts.append("--use-bing")
         if args.use_chatgpt_search:
             command_parts.append("--use-chatgpt-search")
+        if args.multi_search:
+            command_parts.append("--multi-search")
+        if args.no_cache:
+            command_parts.append("--no-cache")
         executed_command = " ".join(command_parts)
         
         with open(prompt_filename, 'w', encoding='utf-8') as f:
@@ -251,7 +289,9 @@ def main():
             f.write("実行情報サマリー:\n")
             f.write(DISPLAY_SEPARATOR_CHAR*DISPLAY_SEPARATOR_LENGTH + "\n")
             f.write(f"検索エンジン: ")
-            if args.use_chatgpt_search:
+            if len(multi_search_engines) > 1:
+                f.write(f"{' + '.join(multi_search_engines)}（並列実行）\n")
+            elif args.use_chatgpt_search:
                 f.write("ChatGPT知識ベース\n")
             elif args.use_bing:
                 f.write("Bing\n")
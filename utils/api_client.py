@@ -2,6 +2,7 @@
 API呼び出し用の共通クライアント
 """
 
+import orjson
 import time
 from typing import Dict, Any, Optional, List
 from openai import OpenAI
@@ -9,7 +10,8 @@ from openai import OpenAI
 from config import (OPENAI_MODEL, OPENAI_MAX_TOKENS, OPENAI_TEMPERATURE,
                     API_PROMPT_SLICE_LENGTH, CHATGPT_FILTER_TEXT_LIMIT,
                     OPENAI_FILTER_MAX_TOKENS, OPENAI_FILTER_TEMPERATURE,
-                    OPENAI_SEARCH_MAX_TOKENS, OPENAI_SEARCH_TEMPERATURE)
+                    OPENAI_SEARCH_MAX_TOKENS, OPENAI_SEARCH_TEMPERATURE,
+                    API_MAX_EXTRACTED_PATTERNS)
 from core.exceptions import OpenAIError
 from core.interfaces import CharacterQuote
 from utils.execution_logger import ExecutionLogger
@@ -29,7 +31,8 @@ class OpenAIClient:
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None,
         logger: Optional[ExecutionLogger] = None,
-        api_type: str = "openai_chat_completion"
+        api_type: str = "openai_chat_completion",
+        response_format: Optional[Dict[str, str]] = None
     ) -> Dict[str, Any]:
         """
         ChatGPT APIを呼び出す
@@ -41,6 +44,7 @@ class OpenAIClient:
             temperature: Temperature値
             logger: ログ記録用
             api_type: APIタイプ（ログ用）
+            response_format: 応答形式（JSONモード指定時など）
             
         Returns:
             API応答と呼び出し情報
@@ -48,12 +52,16 @@ class OpenAIClient:
         start_time = time.time()
         
         try:
-            response = self.client.chat.completions.create(
-                model=model or OPENAI_MODEL,
-                messages=messages,
-                max_tokens=max_tokens or OPENAI_MAX_TOKENS,
-                temperature=temperature or OPENAI_TEMPERATURE
-            )
+            request_params = {
+                "model": model or OPENAI_MODEL,
+                "messages": messages,
+                "max_tokens": max_tokens or OPENAI_MAX_TOKENS,
+                "temperature": temperature or OPENAI_TEMPERATURE
+            }
+            if response_format:
+                request_params["response_format"] = response_format
+            
+            response = self.client.chat.completions.create(**request_params)
             
             duration = time.time() - start_time
             result_text = response.choices[0].message.content.strip()
@@ -201,6 +209,115 @@ class OpenAIClient:
                 })
             return []
     
+    def extract_speech_patterns_batch(
+        self,
+        texts: List[str],
+        character_name: str = "",
+        logger: Optional[ExecutionLogger] = None
+    ) -> List[List[str]]:
+        """
+        複数テキストの口調・セリフパターンを1回のChatGPT API呼び出しで抽出
+        
+        Args:
+            texts: 対象テキストのリスト
+            character_name: キャラクター名
+            logger: ログ記録用
+        
+        Returns:
+            テキストごとのセリフパターンのリスト（入力と同じ順序）
+        """
+        speech_patterns_list: List[List[str]] = [[] for _ in texts]
+        
+        try:
+            if not texts:
+                return speech_patterns_list
+            
+            system_prompt = """あなたは日本語テキストから言語的特徴を中立的に抽出する専門家です。
+事前の知識や推測に頼らず、提供されたテキストに実際に含まれている言語的特徴のみを抽出してください。
+結果は必ずJSONオブジェクトで出力してください。"""
+
+            context_info = f"キャラクター名: {character_name}" if character_name else "キャラクター名: 不明"
+            
+            # テキストが長すぎる場合は切り詰めて番号付きで並べる
+            passages = "\n\n".join(
+                f"[テキスト{index}]\n{text[:CHATGPT_FILTER_TEXT_LIMIT]}"
+                for index, text in enumerate(texts)
+            )
+            
+            user_prompt = f"""以下の{len(texts)}件のテキストそれぞれから、話し方や言語的特徴を中立的に抽出してください。
+
+{context_info}
+
+【抽出対象】
+1. 一人称（実際にテキストで使用されているもののみ）
+2. 語尾パターン（実際にテキストで使用されているもののみ）
+   - あらゆる形の語尾を見逃さずに抽出
+   - ひらがな・カタカナ・記号の組み合わせも正確に保持
+   - 短い語尾、長い語尾、珍しい語尾も含む
+3. 特徴的な表現や決まり文句（実際にテキストで使用されているもののみ）
+4. 呼び方や敬語の使用パターン（実際にテキストで使用されているもののみ）
+
+【重要な原則】
+- テキストに実際に書かれていることのみを抽出
+- 推測や一般的な知識は使用しない
+- 特定の表現様式を排除しない
+- 特殊語尾や珍しい語尾も見逃さずに抽出
+- テキストに含まれる全ての文字・記号を完全な形で保持
+- 語尾の変化形も含めて抽出
+- 見つからない場合は出力しない
+
+【出力形式】
+テキスト番号をキー、抽出結果の配列を値とするJSONオブジェクト：
+{{"0": ["一人称: [実際に使用されていた一人称]", "語尾: [実際に使用されていた語尾]"], "1": ["表現: [実際に使用されていた特徴的表現]", "呼び方: [実際に使用されていた呼び方]"]}}
+
+見つからない項目は出力せず、何も見つからないテキストは空配列にしてください。
+
+分析対象テキスト:
+{passages}"""
+
+            messages = [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ]
+            
+            response = self.chat_completion(
+                messages=messages,
+                max_tokens=min(OPENAI_FILTER_MAX_TOKENS * len(texts), OPENAI_MAX_TOKENS),
+                temperature=OPENAI_FILTER_TEMPERATURE,
+                logger=logger,
+                api_type="openai_speech_pattern_extraction_batch",
+                response_format={"type": "json_object"}
+            )
+            
+            result_data = orjson.loads(response["result"])
+            
+            # 結果を解析（テキスト番号ごとに振り分け）
+            for key, patterns in result_data.items():
+                try:
+                    index = int(key)
+                except (TypeError, ValueError):
+                    continue
+                if not 0 <= index < len(texts) or not isinstance(patterns, list):
+                    continue
+                
+                speech_patterns = []
+                for line in patterns:
+                    line = str(line).strip()
+                    if line and ':' in line:
+                        speech_patterns.append(line)
+                speech_patterns_list[index] = speech_patterns[:API_MAX_EXTRACTED_PATTERNS]
+            
+            return speech_patterns_list
+        
+        except Exception as e:
+            if logger:
+                logger.log_error("speech_pattern_batch_extraction_error", str(e), {
+                    "character_name": character_name,
+                    "text_count": len(texts),
+                    "error_type": type(e).__name__
+                })
+            return speech_patterns_list
+    
     def search_character_info(
         self, 
         search_query: str, 
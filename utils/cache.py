@@ -0,0 +1,171 @@
+"""
+キャッシュ用の共通ユーティリティ
+"""
+
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """有効期限付きのLRUキャッシュ（スレッドセーフ）"""
+    
+    def __init__(self, max_size: int, ttl: float):
+        """
+        初期化
+        
+        Args:
+            max_size: 保持する最大エントリ数（超えた場合は最も古く使われたものから削除）
+            ttl: エントリの有効期限（秒）
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """
+        キャッシュから値を取得
+        
+        Args:
+            key: キャッシュキー
+            default: 存在しないか期限切れの場合に返す値
+            
+        Returns:
+            キャッシュされた値
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+            
+            self._entries.move_to_end(key)
+            return value
+    
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """
+        キャッシュに値を保存
+        
+        Args:
+            key: キャッシュキー
+            value: 保存する値
+            ttl: このエントリの有効期限（秒、省略時はキャッシュ全体の設定値）
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + (ttl if ttl is not None else self.ttl), value)
+            self._entries.move_to_end(key)
+            
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        """キャッシュを全て削除"""
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+
+class DiskCache:
+    """SQLiteに保存する有効期限付きのキャッシュ（プロセスをまたいで再利用可能、スレッドセーフ）"""
+    
+    def __init__(self, path: str):
+        """
+        初期化（ファイルは最初のアクセス時に作成）
+        
+        Args:
+            path: SQLiteファイルのパス
+        """
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+    
+    def _connect(self) -> sqlite3.Connection:
+        """
+        データベースへ接続（ロック取得中に呼び出すこと）
+        
+        Returns:
+            SQLite接続
+        """
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, expires_at REAL NOT NULL, value BLOB NOT NULL)"
+            )
+        return self._conn
+    
+    def get(self, key: str, default: Optional[Any] = None) -> Any:
+        """
+        キャッシュから値を取得
+        
+        Args:
+            key: キャッシュキー
+            default: 存在しないか期限切れの場合に返す値
+            
+        Returns:
+            キャッシュされた値
+        """
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute("SELECT expires_at, value FROM cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return default
+            
+            expires_at, value = row
+            if expires_at <= time.time():
+                conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                conn.commit()
+                return default
+        
+        return pickle.loads(value)
+    
+    def set(self, key: str, value: Any, ttl: float):
+        """
+        キャッシュに値を保存
+        
+        Args:
+            key: キャッシュキー
+            value: 保存する値（pickle可能なもの）
+            ttl: 有効期限（秒）
+        """
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (key, expires_at, value) VALUES (?, ?, ?)",
+                (key, time.time() + ttl, data)
+            )
+            conn.commit()
+    
+    def clear(self):
+        """キャッシュを全て削除"""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM cache")
+            conn.commit()
+    
+    def close(self):
+        """データベース接続を閉じる"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM cache").fetchone()[0]
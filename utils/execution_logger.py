@@ -2,14 +2,16 @@
 実行ログ記録モジュール - 分析用のキャッシュ機能
 """
 
+import atexit
 import json
 import os
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
-from config import JSON_INDENT_LEVEL
+from config import JSON_INDENT_LEVEL, EXECUTION_LOG_FLUSH_INTERVAL
 
 
 class ExecutionLogger:
@@ -25,6 +27,15 @@ class ExecutionLogger:
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
         
+        # 複数スレッドからのログ記録・保存を直列化するロック
+        self._lock = threading.RLock()
+        # ファイル書き込みを直列化するロック（書き込み中もログ記録は止めない）
+        self._write_lock = threading.Lock()
+        
+        # 未保存の変更があるか。バックグラウンドスレッドが一定間隔でまとめて保存する
+        self._dirty = False
+        self._flush_thread: Optional[threading.Thread] = None
+        
         # 実行セッションの開始
         self.session_start = datetime.now()
         self.session_id = self.session_start.strftime("%Y%m%d_%H%M%S")
@@ -63,10 +74,11 @@ class ExecutionLogger:
             "duration": duration
         }
         
-        self.execution_log["steps"].append(step_data)
-        
-        # リアルタイムで保存
-        self._save_log()
+        with self._lock:
+            self.execution_log["steps"].append(step_data)
+            
+            # 次の書き出しでまとめて保存
+            self._mark_dirty()
     
     def log_api_call(self, api_type: str, request_data: Dict[str, Any], response_data: Dict[str, Any], 
                      duration: float = None, error: str = None):
@@ -90,10 +102,11 @@ class ExecutionLogger:
             "status": "error" if error else "success"
         }
         
-        self.execution_log["api_calls"].append(api_call_data)
-        
-        # リアルタイムで保存
-        self._save_log()
+        with self._lock:
+            self.execution_log["api_calls"].append(api_call_data)
+            
+            # 次の書き出しでまとめて保存
+            self._mark_dirty()
     
     def log_error(self, error_type: str, error_message: str, context: Dict[str, Any] = None):
         """
@@ -111,10 +124,11 @@ class ExecutionLogger:
             "context": context or {}
         }
         
-        self.execution_log["errors"].append(error_data)
-        
-        # リアルタイムで保存
-        self._save_log()
+        with self._lock:
+            self.execution_log["errors"].append(error_data)
+            
+            # 次の書き出しでまとめて保存
+            self._mark_dirty()
     
     def log_performance_metric(self, metric_name: str, value: Any, unit: str = None):
         """
@@ -125,14 +139,15 @@ class ExecutionLogger:
             value: 値
             unit: 単位
         """
-        self.execution_log["performance"][metric_name] = {
-            "value": value,
-            "unit": unit,
-            "timestamp": datetime.now().isoformat()
-        }
-        
-        # リアルタイムで保存
-        self._save_log()
+        with self._lock:
+            self.execution_log["performance"][metric_name] = {
+                "value": value,
+                "unit": unit,
+                "timestamp": datetime.now().isoformat()
+            }
+            
+            # 次の書き出しでまとめて保存
+            self._mark_dirty()
     
     def set_final_result(self, result: Dict[str, Any]):
         """
@@ -141,30 +156,66 @@ class ExecutionLogger:
         Args:
             result: 最終結果データ
         """
-        self.execution_log["final_result"] = result
-        self.execution_log["session_end"] = datetime.now().isoformat()
+        with self._lock:
+            self.execution_log["final_result"] = result
+            self.execution_log["session_end"] = datetime.now().isoformat()
+            
+            self._dirty = True
         
-        # 最終保存
-        self._save_log()
+        # 最終保存（待たずに即座に書き出す）
+        self.flush()
+    
+    def _mark_dirty(self):
+        """未保存の変更があることを記録し、必要なら書き出し用スレッドを起動"""
+        with self._lock:
+            self._dirty = True
+            if self._flush_thread is None:
+                self._flush_thread = threading.Thread(target=self._flush_loop, name="execution-log-flush", daemon=True)
+                self._flush_thread.start()
+                # 終了時に未保存の変更を書き出す
+                atexit.register(self.flush)
+    
+    def _flush_loop(self):
+        """一定間隔で未保存の変更を書き出す（デーモンスレッドで実行）"""
+        while True:
+            time.sleep(EXECUTION_LOG_FLUSH_INTERVAL)
+            self.flush()
+    
+    def flush(self):
+        """未保存の変更があればログをファイルに保存"""
+        with self._write_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                self._dirty = False
+                # 書き込み中も他スレッドがログを記録できるよう、先に文字列化してからロックを外す
+                try:
+                    serialized = json.dumps(self.execution_log, ensure_ascii=False, indent=JSON_INDENT_LEVEL)
+                except Exception as e:
+                    print(f"⚠️ ログ保存エラー: {e}")
+                    return
+            self._write_log(serialized)
     
-    def _save_log(self):
-        """ログをファイルに保存"""
+    def _write_log(self, serialized: str):
+        """
+        文字列化したログをファイルに書き込み
+        
+        Args:
+            serialized: JSON文字列
+        """
         try:
             # セッション別のログファイル
             log_file = self.cache_dir / f"execution_log_{self.session_id}.json"
             
-            # ログ保存時の進捗を表示（頻繁すぎるので削除）
-            # print(f"  💾 ログ更新中: {log_file.name}")
-            
             with open(log_file, 'w', encoding='utf-8') as f:
-                json.dump(self.execution_log, f, ensure_ascii=False, indent=JSON_INDENT_LEVEL)
+                f.write(serialized)
                 f.flush()  # 強制的にバッファをフラッシュ
                 os.fsync(f.fileno())  # OSレベルでの書き込み強制
             
             # 最新ログのシンボリックリンク的な役割
             latest_log_file = self.cache_dir / "latest_execution_log.json"
             with open(latest_log_file, 'w', encoding='utf-8') as f:
-                json.dump(self.execution_log, f, ensure_ascii=False, indent=JSON_INDENT_LEVEL)
+                f.write(serialized)
                 f.flush()  # 強制的にバッファをフラッシュ
                 os.fsync(f.fileno())  # OSレベルでの書き込み強制
                 
@@ -3,9 +3,13 @@ HTTP クライアント用の共通ユーティリティ
 """
 
 import requests
+import threading
 import time
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
 from typing import Dict, Any, Optional
 from urllib.parse import urlparse
+from urllib3.util.retry import Retry
 
 from config import (DEFAULT_DELAY, DEFAULT_USER_AGENT, HTTP_DEFAULT_DELAY,
                     HTTP_DEFAULT_TIMEOUT, HTTP_DEFAULT_MAX_RETRIES,
@@ -13,7 +17,79 @@ from config import (DEFAULT_DELAY, DEFAULT_USER_AGENT, HTTP_DEFAULT_DELAY,
                     HTTP_CONNECTION_ERROR_WAIT_MULTIPLIER,
                     HTTP_SKIP_RETRY_STATUS_CODES, HTTP_STATUS_NOT_FOUND,
                     HTTP_STATUS_FORBIDDEN, HTTP_STATUS_NOT_ACCEPTABLE,
-                    HTTP_STATUS_GONE, HTTP_STATUS_SERVICE_UNAVAILABLE)
+                    HTTP_STATUS_GONE, HTTP_STATUS_SERVICE_UNAVAILABLE,
+                    HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE,
+                    HTTP_ADAPTER_RETRY_TOTAL, HTTP_ADAPTER_BACKOFF_FACTOR,
+                    HTTP_ADAPTER_RETRY_STATUS_CODES, HTTP_STREAM_CHUNK_SIZE,
+                    HTTP_SESSION_MAX_AGE)
+
+
+class PooledSession(requests.Session):
+    """一定時間ごとにコネクションプールを破棄して古いkeep-alive接続を使い回さないセッション"""
+    
+    def __init__(self, max_age: float = None):
+        """
+        初期化
+        
+        Args:
+            max_age: プールを保持する最大秒数
+        """
+        super().__init__()
+        self.max_age = max_age if max_age is not None else HTTP_SESSION_MAX_AGE
+        self._pool_created_at = time.monotonic()
+        self._pool_lock = threading.Lock()
+    
+    def request(self, method, url, *args, **kwargs) -> requests.Response:
+        """
+        プールの寿命を確認してからリクエストを送信
+        
+        Args:
+            method: HTTPメソッド
+            url: リクエスト先URL
+            *args: その他のrequestsパラメータ
+            **kwargs: その他のrequestsパラメータ
+            
+        Returns:
+            HTTPレスポンス
+        """
+        self._recycle_pools_if_expired()
+        return super().request(method, url, *args, **kwargs)
+    
+    def close(self):
+        """セッションが所有するアダプターのみ閉じる（共有アダプターは他のセッションが使用中）"""
+        for adapter in self._owned_adapters():
+            adapter.close()
+    
+    def _owned_adapters(self):
+        """
+        このセッション専用のアダプターを列挙（共有アダプターを除く）
+        
+        Returns:
+            アダプターのリスト
+        """
+        seen_ids = {id(adapter) for adapter in list(_SHARED_ADAPTERS.values())}
+        owned = []
+        for adapter in self.adapters.values():
+            if id(adapter) in seen_ids:
+                continue
+            seen_ids.add(id(adapter))
+            owned.append(adapter)
+        return owned
+    
+    def _recycle_pools_if_expired(self):
+        """寿命を過ぎたコネクションプールを破棄（ヘッダーやアダプター設定は維持）"""
+        # 共有アダプターの寿命はアダプター単位で管理する
+        _recycle_shared_adapters_if_expired()
+        
+        if time.monotonic() - self._pool_created_at <= self.max_age:
+            return
+        
+        with self._pool_lock:
+            if time.monotonic() - self._pool_created_at <= self.max_age:
+                return
+            for adapter in self._owned_adapters():
+                adapter.close()
+            self._pool_created_at = time.monotonic()
 
 
 class BaseHTTPClient:
@@ -29,7 +105,7 @@ class BaseHTTPClient:
         """
         self.delay = delay if delay is not None else HTTP_DEFAULT_DELAY
         self.timeout = timeout if timeout is not None else HTTP_DEFAULT_TIMEOUT
-        self.session = requests.Session()
+        self.session = PooledSession()
         
         # 標準的なHTTPヘッダーを設定
         self.session.headers.update({
@@ -181,6 +257,92 @@ class SearchHTTPClient(BaseHTTPClient):
         })
 
 
+# プロセス内で共有するHTTPAdapter（リトライ有無ごとに1つ）。全コレクターのセッションが同じ
+# コネクションプールを使い、同じホストへのkeep-alive接続とTLSセッションを使い回す
+_SHARED_ADAPTERS: Dict[bool, HTTPAdapter] = {}
+_SHARED_ADAPTERS_CREATED_AT: Dict[bool, float] = {}
+_SHARED_ADAPTERS_LOCK = threading.Lock()
+
+
+def _recycle_shared_adapters_if_expired():
+    """
+    寿命を過ぎた共有アダプターのコネクションプールを破棄
+    
+    寿命はアダプターごとに1つのタイムスタンプで管理するため、どのセッションから呼ばれても
+    各アダプターのプールは HTTP_SESSION_MAX_AGE ごとに1回だけ破棄される。
+    """
+    now = time.monotonic()
+    if all(now - created_at <= HTTP_SESSION_MAX_AGE
+           for created_at in list(_SHARED_ADAPTERS_CREATED_AT.values())):
+        return
+    
+    with _SHARED_ADAPTERS_LOCK:
+        now = time.monotonic()
+        for with_retry, created_at in _SHARED_ADAPTERS_CREATED_AT.items():
+            if now - created_at > HTTP_SESSION_MAX_AGE:
+                _SHARED_ADAPTERS[with_retry].close()
+                _SHARED_ADAPTERS_CREATED_AT[with_retry] = now
+
+
+def _get_shared_adapter(with_retry: bool) -> HTTPAdapter:
+    """
+    共有のHTTPAdapterを取得（未生成の場合のみ生成）
+    
+    Args:
+        with_retry: 429/5xxエラー時にアダプターレベルでリトライするか
+        
+    Returns:
+        共有のHTTPAdapter
+    """
+    adapter = _SHARED_ADAPTERS.get(with_retry)
+    if adapter is not None:
+        return adapter
+    
+    with _SHARED_ADAPTERS_LOCK:
+        adapter = _SHARED_ADAPTERS.get(with_retry)
+        if adapter is None:
+            if with_retry:
+                max_retries = Retry(
+                    total=HTTP_ADAPTER_RETRY_TOTAL,
+                    backoff_factor=HTTP_ADAPTER_BACKOFF_FACTOR,
+                    status_forcelist=HTTP_ADAPTER_RETRY_STATUS_CODES,
+                    respect_retry_after_header=True,
+                    raise_on_status=False  # リトライ後も失敗した場合はレスポンスをそのまま返す
+                )
+            else:
+                max_retries = 0
+            
+            adapter = HTTPAdapter(
+                pool_connections=HTTP_POOL_CONNECTIONS,
+                pool_maxsize=HTTP_POOL_MAXSIZE,
+                max_retries=max_retries,
+                pool_block=False
+            )
+            _SHARED_ADAPTERS[with_retry] = adapter
+            _SHARED_ADAPTERS_CREATED_AT[with_retry] = time.monotonic()
+        return adapter
+
+
+def mount_pooled_adapter(session: requests.Session, with_retry: bool = True) -> requests.Session:
+    """
+    コネクションプールを拡張したHTTPAdapterをセッションに設定
+    
+    アダプターはプロセス内で共有するため、ヘッダーの異なるセッション間でも接続を使い回せる。
+    
+    Args:
+        session: 対象のセッション
+        with_retry: 429/5xxエラー時にアダプターレベルでリトライするか
+                    （呼び出し側で独自にリトライする場合はFalse）
+        
+    Returns:
+        設定済みのセッション
+    """
+    adapter = _get_shared_adapter(with_retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
 def validate_url(url: str) -> str:
     """
     URLの検証と修正
@@ -205,6 +367,7 @@ def validate_url(url: str) -> str:
     return url
 
 
+@lru_cache(maxsize=4096)
 def extract_domain(url: str) -> str:
     """
     URLからドメインを抽出
@@ -221,7 +384,35 @@ def extract_domain(url: str) -> str:
         return "unknown"
 
 
-def safe_http_get(url: str, max_retries: int = 2, timeout: int = 15, logger=None, quiet: bool = False) -> Optional[requests.Response]:
+def read_limited_content(response: requests.Response, max_bytes: int) -> bytes:
+    """
+    ストリーミングレスポンスの本文を上限バイト数まで読み込む
+    
+    Args:
+        response: stream=Trueで取得したHTTPレスポンス
+        max_bytes: 読み込む最大バイト数
+        
+    Returns:
+        読み込んだ本文（上限を超えた分は切り捨て）
+    """
+    chunks = []
+    total = 0
+    
+    try:
+        for chunk in response.iter_content(chunk_size=HTTP_STREAM_CHUNK_SIZE):
+            chunks.append(chunk)
+            total += len(chunk)
+            if total >= max_bytes:
+                break
+    finally:
+        # 残りを読まずに接続を閉じる
+        response.close()
+    
+    return b''.join(chunks)[:max_bytes]
+
+
+def safe_http_get(url: str, max_retries: int = 2, timeout: int = 15, logger=None, quiet: bool = False,
+                  client: Optional[BaseHTTPClient] = None, stream: bool = False) -> Optional[requests.Response]:
     """
     安全なHTTP GETリクエスト（エラーハンドリング付き）
     
@@ -230,6 +421,9 @@ def safe_http_get(url: str, max_retries: int = 2, timeout: int = 15, logger=None
         max_retries: 最大リトライ回数
         timeout: タイムアウト時間（秒）
         logger: ログ記録用（オプション）
+        quiet: エラー出力を抑制するか
+        client: 再利用するHTTPクライアント（省略時は都度作成して終了時に閉じる）
+        stream: 本文を読み込まずに返すか（read_limited_contentと併用。clientの指定が必要）
         
     Returns:
         HTTPレスポンス（失敗時はNone）
@@ -241,10 +435,12 @@ def safe_http_get(url: str, max_retries: int = 2, timeout: int = 15, logger=None
             logger.log_error("invalid_url", f"無効なURL: {url}", {"original_url": url})
         return None
     
-    client = BaseHTTPClient(delay=0, timeout=timeout)
+    owns_client = client is None
+    if owns_client:
+        client = BaseHTTPClient(delay=0, timeout=timeout)
     
     try:
-        response = client.get(validated_url, max_retries=max_retries)
+        response = client.get(validated_url, max_retries=max_retries, timeout=timeout, stream=stream)
         return response
         
     except requests.exceptions.HTTPError as http_err:
@@ -293,4 +489,5 @@ def safe_http_get(url: str, max_retries: int = 2, timeout: int = 15, logger=None
         return None
         
     finally:
-        client.close()
\ No newline at end of file
+        if owns_client:
+            client.close()
\ No newline at end of file
@@ -0,0 +1,53 @@
+"""
+コンソールログ出力の設定
+"""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+import sys
+from typing import Optional
+
+from config import CONSOLE_LOG_FORMAT, CONSOLE_LOG_APP_LOGGERS
+
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def setup_console_logging(level: int = logging.INFO) -> logging.handlers.QueueListener:
+    """
+    ルートロガーをキュー経由のコンソール出力に設定
+    
+    各スレッドはキューへ積むだけで、書き込みはバックグラウンドのリスナースレッドが行う。
+    指定レベルはアプリ側のロガーにのみ適用し、サードパーティ（httpx等）はWARNING以上に抑える
+    
+    Args:
+        level: 出力するログレベル
+        
+    Returns:
+        起動済みのQueueListener
+    """
+    global _listener
+    
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.WARNING)
+    for logger_name in CONSOLE_LOG_APP_LOGGERS:
+        logging.getLogger(logger_name).setLevel(level)
+    
+    if _listener is not None:
+        return _listener
+    
+    log_queue = queue.Queue(-1)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setFormatter(logging.Formatter(CONSOLE_LOG_FORMAT))
+    
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    _listener.start()
+    
+    # 終了時にキューに残ったログを書き出す
+    atexit.register(_listener.stop)
+    
+    return _listener
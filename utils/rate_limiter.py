@@ -0,0 +1,140 @@
+"""
+レート制限用の共通ユーティリティ
+"""
+
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+
+class TokenBucket:
+    """トークンバケット方式のレートリミッター（スレッドセーフ）"""
+    
+    def __init__(self, rate: float, capacity: float):
+        """
+        初期化
+        
+        Args:
+            rate: 1秒あたりに補充されるトークン数
+            capacity: バケットに貯められる最大トークン数（バースト許容量）
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self):
+        """経過時間に応じてトークンを補充（ロック取得済みで呼び出すこと）"""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+    
+    def acquire(self, tokens: float = 1):
+        """
+        トークンを取得（不足している場合は補充されるまで待機）
+        
+        Args:
+            tokens: 取得するトークン数
+        """
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait_time = (tokens - self._tokens) / self.rate
+            
+            # 待機中は他のスレッドがトークンを取得できるようロックを解放しておく
+            time.sleep(wait_time)
+    
+    def penalize(self, tokens: float):
+        """
+        レート制限を受けた場合にトークンを差し引き、以降のリクエストを遅らせる
+        
+        Args:
+            tokens: 差し引くトークン数（残量はマイナスになり得る）
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+
+
+class SlidingWindow:
+    """スライディングウィンドウ方式のレートリミッター（スレッドセーフ）"""
+    
+    def __init__(self, window: float, limit: int):
+        """
+        初期化
+        
+        Args:
+            window: ウィンドウの長さ（秒）
+            limit: ウィンドウ内で許可するリクエスト数
+        """
+        self.window = window
+        self.limit = limit
+        self._timestamps: deque = deque()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+    
+    def wait_until_allowed(self):
+        """リクエストが許可されるまで待機し、許可されたリクエストを記録"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                
+                # ウィンドウ外になった記録を削除
+                while self._timestamps and now - self._timestamps[0] >= self.window:
+                    self._timestamps.popleft()
+                
+                if now < self._blocked_until:
+                    wait_time = self._blocked_until - now
+                elif len(self._timestamps) >= self.limit:
+                    wait_time = self.window - (now - self._timestamps[0])
+                else:
+                    self._timestamps.append(now)
+                    return
+            
+            time.sleep(wait_time)
+    
+    def cooldown(self, seconds: float):
+        """
+        指定時間は全てのリクエストを待機させる（429エラー時など）
+        
+        Args:
+            seconds: 待機させる時間（秒）
+        """
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Retry-Afterヘッダーの値を待機秒数に変換
+    
+    Args:
+        value: ヘッダーの値（秒数またはHTTP日付）
+        
+    Returns:
+        待機秒数（解釈できない場合はNone）
+    """
+    if not value:
+        return None
+    
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())